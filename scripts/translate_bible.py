@@ -1 +1,483 @@
-        description="🎭 HOLY REMIX - AI-Powered Scripture Translation", 
\ No newline at end of file
+#!/usr/bin/env python3
+"""
+AI Bible Translation CLI
+
+Translates the Bible into different persona voices using Amazon Bedrock.
+Supports single chapters, full-Bible runs, dry runs, and batched prompts
+that pack several chapters into one model invocation.
+"""
+
+import asyncio
+import functools
+import json
+import sys
+import argparse
+from pathlib import Path
+from typing import Dict, Any
+
+# Add src to path
+sys.path.append(str(Path(__file__).parent.parent / "src" / "holyremix"))
+
+# NOTE: translators.bedrock_translator (and its boto3/tiktoken imports) is
+# deliberately imported lazily inside the functions that translate, so
+# --help and --list-personas don't pay the import tax
+from utils.persona_loader import load_personas
+
+# orjson skips indent/ensure_ascii overhead on the hot write path
+try:
+    import orjson
+
+    def _dumps_line(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps_line(obj: Dict[str, Any]) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def get_persona_prompts() -> Dict[str, Any]:
+    """
+    Get all available personas with their metadata.
+
+    Returns:
+        Dictionary mapping persona keys to persona metadata
+    """
+    return load_personas()
+
+
+def load_kjv_data(kjv_file: str) -> Dict[str, Any]:
+    """
+    Load the restructured KJV Bible data.
+
+    Args:
+        kjv_file: Path to the KJV Bible JSON file
+
+    Returns:
+        KJV data dictionary in {book: {chapter: {verse: text}}} format
+    """
+    try:
+        # One read_bytes syscall + C-side parse instead of streaming through
+        # Python's text I/O layer
+        return _loads(Path(kjv_file).read_bytes())
+    except FileNotFoundError:
+        print(f"❌ KJV file not found: {kjv_file}")
+        print("💡 Run 'make preprocess' first to generate KJV data")
+        sys.exit(1)
+
+
+def load_kjv_subset(kjv_file: str, book: str, chapter: str = None) -> Dict[str, Any]:
+    """
+    Stream just the requested book/chapter subtree from the KJV file.
+
+    Uses ijson so a targeted --book/--chapter invocation parses only the
+    relevant subtree instead of the entire Bible.
+
+    Args:
+        kjv_file: Path to the KJV Bible JSON file
+        book: Bible book name
+        chapter: Optional chapter number
+
+    Returns:
+        KJV data dictionary containing only the requested subtree
+    """
+    import ijson
+
+    prefix = f"{book}.{chapter}" if chapter else book
+
+    try:
+        with open(kjv_file, 'rb') as f:
+            for subtree in ijson.items(f, prefix):
+                if chapter:
+                    return {book: {chapter: subtree}}
+                return {book: subtree}
+    except FileNotFoundError:
+        print(f"❌ KJV file not found: {kjv_file}")
+        print("💡 Run 'make preprocess' first to generate KJV data")
+        sys.exit(1)
+
+    return {}
+
+
+def list_available_personas() -> None:
+    """Print all available personas with their descriptions."""
+    personas = get_persona_prompts()
+
+    print("🎭 Available personas:")
+    print("=" * 50)
+    for key, data in personas.items():
+        display_name = data.get('display_name', key)
+        description = data.get('description', '')
+        print(f"  {key}: {display_name}")
+        if description:
+            print(f"      {description}")
+
+
+def save_translation(result: Dict[str, Any], persona: str) -> None:
+    """Save a translated Bible to its per-persona output file."""
+    output_file = f"translated_bible_{persona}.json"
+    if orjson:
+        # orjson's C indentation pass emits UTF-8 bytes directly — far faster
+        # than stdlib json.dump(indent=2) over the ~31k-leaf dict
+        Path(output_file).write_bytes(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+    print(f"💾 Translation saved to {output_file}")
+
+
+def jsonl_output_path(persona: str) -> Path:
+    """Per-persona incremental JSONL output file."""
+    return Path("data/processed") / f"translated_bible_{persona}.jsonl"
+
+
+def load_completed_from_jsonl(jsonl_file: Path) -> set:
+    """
+    Scan an existing JSONL output file for already-translated chapters.
+
+    Args:
+        jsonl_file: Path to the per-persona JSONL file
+
+    Returns:
+        Set of "{book}_{chapter}" keys already written
+    """
+    completed = set()
+    if not jsonl_file.exists():
+        return completed
+
+    with open(jsonl_file, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _loads(line)
+                completed.add(f"{record['book']}_{record['chapter']}")
+            except (ValueError, KeyError):
+                continue
+
+    if completed:
+        print(f"🔁 Resuming: {len(completed)} chapters already in {jsonl_file}")
+    return completed
+
+
+def jsonl_to_nested_json(jsonl_file: Path, persona: str) -> Dict[str, Any]:
+    """
+    Finalize a JSONL run into the nested {book: {chapter: verses}} JSON file.
+
+    Args:
+        jsonl_file: Path to the per-persona JSONL file
+        persona: Persona name for translation
+
+    Returns:
+        The nested translated Bible data
+    """
+    result = {}
+    with open(jsonl_file, 'rb') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = _loads(line)
+                result.setdefault(record['book'], {})[record['chapter']] = record['verses']
+            except (ValueError, KeyError):
+                continue
+
+    save_translation(result, persona)
+    return result
+
+
+def flatten_translation(result: Dict[str, Any]):
+    """
+    Yield (book, chapter, verse, text) rows from a nested translated Bible.
+
+    One flat pass instead of re-walking the triple-nested dict for every
+    statistic or export.
+
+    Args:
+        result: Nested translated Bible data
+
+    Yields:
+        Tuples of (book, chapter, verse, text)
+    """
+    for book, chapters in result.items():
+        for chapter, verses in chapters.items():
+            for verse, text in verses.items():
+                yield book, chapter, verse, text
+
+
+def summarize_translation(result: Dict[str, Any], persona: str) -> None:
+    """
+    Print book/chapter/verse totals for a finished translation.
+
+    Args:
+        result: Nested translated Bible data
+        persona: Persona name for translation
+    """
+    chapters = set()
+    verses = 0
+    for book, chapter, _verse, _text in flatten_translation(result):
+        chapters.add((book, chapter))
+        verses += 1
+
+    print(f"📊 {persona}: {len(result)} books, {len(chapters)} chapters, {verses} verses translated")
+
+
+def save_translation_parquet(result: Dict[str, Any], persona: str) -> None:
+    """
+    Optionally persist a flat columnar copy of the translation as Parquet.
+
+    Skipped silently when pyarrow isn't installed. The columnar file is much
+    smaller than indented JSON and makes verse-level analytics one-liners.
+
+    Args:
+        result: Nested translated Bible data
+        persona: Persona name for translation
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return
+
+    rows = list(flatten_translation(result))
+    if not rows:
+        return
+
+    books, chapters, verses, texts = zip(*rows)
+    table = pa.table({
+        "book": books,
+        "chapter": chapters,
+        "verse": verses,
+        "translation": texts
+    })
+
+    output_file = f"translated_bible_{persona}.parquet"
+    pq.write_table(table, output_file)
+    print(f"💾 Columnar copy saved to {output_file}")
+
+
+def build_chapter_token_table(translator: "BedrockTranslator", kjv_data: Dict[str, Any]) -> Dict[tuple, int]:
+    """
+    Tokenize every chapter once, up front, in a single batched pass.
+
+    The resulting table lets budget checks for every (persona, chapter) pair
+    reduce to dictionary lookups and arithmetic instead of repeated BPE
+    encoding inside the translation loop.
+
+    Args:
+        translator: BedrockTranslator used for tokenization
+        kjv_data: Restructured KJV data
+
+    Returns:
+        Dictionary mapping (book, chapter) to input token count
+    """
+    from translators.bedrock_translator import TranslationManager
+
+    keys = []
+    texts = []
+    for book, chapters in kjv_data.items():
+        for chapter, verses in chapters.items():
+            keys.append((book, chapter))
+            texts.append("\n".join([
+                f"{verse_num}. {verse_text}"
+                for verse_num, verse_text in sorted(verses.items(), key=lambda x: int(x[0]))
+            ]))
+
+    token_table = dict(zip(keys, translator.count_tokens_batch(texts)))
+
+    oversize = sum(1 for tokens in token_table.values()
+                   if tokens >= TranslationManager.BATCH_TOKEN_BUDGET)
+    print(f"📊 Preflight: {len(token_table)} chapters tokenized, "
+          f"{oversize} exceed the batch token budget and will be translated solo")
+
+    return token_table
+
+
+def translate_single_persona(kjv_data: Dict[str, Any], persona: str, dry_run: bool = False,
+                             batch_size: int = 1, token_table: Dict[tuple, int] = None) -> None:
+    """
+    Translate the entire Bible for a single persona.
+
+    Each chapter is appended to a JSONL file as soon as it completes, so a
+    killed run loses no finished work and resumes without re-spending tokens.
+
+    Args:
+        kjv_data: Restructured KJV data
+        persona: Persona name for translation
+        dry_run: If True, only show what would be translated
+        batch_size: Number of chapters to pack per Bedrock invocation
+        token_table: Optional precomputed {(book, chapter): tokens} table
+    """
+    from translators.bedrock_translator import BedrockTranslator, TranslationManager
+
+    translator = BedrockTranslator()
+
+    if token_table is None:
+        token_table = build_chapter_token_table(translator, kjv_data)
+
+    jsonl_file = jsonl_output_path(persona)
+    jsonl_file.parent.mkdir(parents=True, exist_ok=True)
+    completed = load_completed_from_jsonl(jsonl_file)
+
+    with open(jsonl_file, 'ab') as f:
+        def write_chapter(book, chapter, verses):
+            f.write(_dumps_line({"book": book, "chapter": chapter, "verses": verses}))
+            f.flush()
+
+        manager = TranslationManager(translator, batch_size=batch_size, on_chapter=write_chapter,
+                                     token_table=token_table)
+        manager.translate_bible(kjv_data, persona, dry_run, skip_chapters=completed)
+
+    if not dry_run:
+        result = jsonl_to_nested_json(jsonl_file, persona)
+        summarize_translation(result, persona)
+        save_translation_parquet(result, persona)
+
+
+async def atranslate_single_persona(kjv_data: Dict[str, Any], persona: str, dry_run: bool = False,
+                                    batch_size: int = 1,
+                                    semaphore: asyncio.Semaphore = None,
+                                    token_table: Dict[tuple, int] = None) -> None:
+    """
+    Async variant of translate_single_persona sharing a concurrency bound.
+
+    Args:
+        kjv_data: Restructured KJV data
+        persona: Persona name for translation
+        dry_run: If True, only show what would be translated
+        batch_size: Number of chapters to pack per Bedrock invocation
+        semaphore: Shared semaphore bounding in-flight Bedrock requests
+        token_table: Optional precomputed {(book, chapter): tokens} table
+    """
+    from translators.bedrock_translator import BedrockTranslator, TranslationManager
+
+    translator = BedrockTranslator()
+
+    if token_table is None:
+        token_table = build_chapter_token_table(translator, kjv_data)
+
+    jsonl_file = jsonl_output_path(persona)
+    jsonl_file.parent.mkdir(parents=True, exist_ok=True)
+    completed = load_completed_from_jsonl(jsonl_file)
+
+    with open(jsonl_file, 'ab') as f:
+        def write_chapter(book, chapter, verses):
+            f.write(_dumps_line({"book": book, "chapter": chapter, "verses": verses}))
+            f.flush()
+
+        manager = TranslationManager(translator, batch_size=batch_size, on_chapter=write_chapter,
+                                     token_table=token_table)
+        await manager.atranslate_bible(kjv_data, persona, dry_run, semaphore,
+                                       skip_chapters=completed)
+
+    if not dry_run:
+        result = jsonl_to_nested_json(jsonl_file, persona)
+        summarize_translation(result, persona)
+        save_translation_parquet(result, persona)
+
+
+async def translate_all_personas(kjv_data: Dict[str, Any], dry_run: bool = False,
+                                 batch_size: int = 1, concurrency: int = 4) -> None:
+    """
+    Translate the Bible for every persona concurrently.
+
+    Chapter-level requests from all personas share one semaphore so total
+    in-flight Bedrock calls stay under the account rate limit.
+
+    Args:
+        kjv_data: Restructured KJV data
+        dry_run: If True, only show what would be translated
+        batch_size: Number of chapters to pack per Bedrock invocation
+        concurrency: Maximum concurrent Bedrock requests across all personas
+    """
+    from translators.bedrock_translator import BedrockTranslator
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # Tokenize every chapter once and share the table — the chapter texts are
+    # identical for all personas
+    token_table = build_chapter_token_table(BedrockTranslator(), kjv_data)
+
+    await asyncio.gather(*[
+        atranslate_single_persona(kjv_data, persona, dry_run, batch_size, semaphore, token_table)
+        for persona in get_persona_prompts().keys()
+    ])
+
+
+def main():
+    """Main function for the translation CLI."""
+    parser = argparse.ArgumentParser(description="AI Bible Translator")
+    parser.add_argument("--persona", help="Persona name for translation")
+    parser.add_argument("--all-personas", action="store_true", help="Translate for all available personas")
+    parser.add_argument("--list-personas", action="store_true", help="List available personas and exit")
+    parser.add_argument("--book", help="Specific book to translate (optional)")
+    parser.add_argument("--chapter", help="Specific chapter to translate (optional)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be translated without actually translating")
+    parser.add_argument("--batch-size", type=int, default=1, help="Chapters per Bedrock invocation (1 disables batching)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum concurrent Bedrock requests")
+    parser.add_argument("--kjv-file", default="data/processed/kjv_bible.json", help="Path to KJV Bible JSON file")
+
+    args = parser.parse_args()
+
+    if args.list_personas:
+        list_available_personas()
+        return
+
+    if not args.persona and not args.all_personas:
+        parser.error("one of --persona, --all-personas, or --list-personas is required")
+
+    # Validate cheap arguments before paying for the KJV parse
+    if args.persona and args.persona not in get_persona_prompts():
+        print(f"❌ Unknown persona: {args.persona}")
+        print("💡 Use --list-personas to see available personas")
+        sys.exit(1)
+
+    if args.book:
+        from data.book_names import BOOK_NAMES
+        if args.book not in BOOK_NAMES:
+            print(f"❌ Unknown book: {args.book}")
+            sys.exit(1)
+
+    # Load KJV data; a targeted --book (or --book/--chapter) run only
+    # needs its own subtree, and downstream paths translate exactly what
+    # is loaded
+    if args.book:
+        kjv_data = load_kjv_subset(args.kjv_file, args.book, args.chapter)
+    else:
+        kjv_data = load_kjv_data(args.kjv_file)
+
+    if args.book and args.chapter:
+        # Translate specific chapter — for every persona when
+        # --all-personas is set, otherwise the one requested
+        if args.book in kjv_data and args.chapter in kjv_data[args.book]:
+            from translators.bedrock_translator import BedrockTranslator
+
+            translator = BedrockTranslator()
+            verses = kjv_data[args.book][args.chapter]
+            personas = list(get_persona_prompts()) if args.all_personas else [args.persona]
+            for persona in personas:
+                result = translator.translate_chapter(args.book, args.chapter, verses, persona)
+                if result:
+                    print(f"✅ Translation complete for {args.book} {args.chapter} as {persona}:")
+                    for verse_num, text in result.items():
+                        print(f"{verse_num}. {text}")
+                else:
+                    print(f"❌ Translation failed for {args.book} {args.chapter} as {persona}")
+        else:
+            print(f"❌ Chapter {args.book} {args.chapter} not found")
+    elif args.all_personas:
+        asyncio.run(translate_all_personas(kjv_data, args.dry_run, args.batch_size, args.concurrency))
+    else:
+        translate_single_persona(kjv_data, args.persona, args.dry_run, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
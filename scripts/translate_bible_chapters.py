@@ -9,9 +9,13 @@ Intelligently translates Bible chapters using the hybrid approach:
 """
 
 import json
+import os
+import queue
+import threading
 import time
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 import boto3
@@ -19,20 +23,63 @@ from botocore.exceptions import ClientError
 import logging
 
 # Add src to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
+sys.path.append(str(Path(__file__).parent.parent / "src" / "holyremix"))
 
+from data.book_names import BOOK_NAMES
 from translators.chapter_translator import ChapterTranslator, VerseByVerseTranslator
 from storage.dynamodb_loader import DynamoDBLoader
 from utils.cost_calculator import CostCalculator
 
+try:
+    import orjson
+
+    def _dumps_line(obj: Any) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+
+    def _dumps_line(obj: Any) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    _loads = json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _approx_tokens(s: str) -> int:
+    """Rough token count via the ~4-chars-per-token BPE rule of thumb."""
+    return (len(s) + 3) // 4
+
+
+# Completed chapters are tracked as packed ints — canonical book id in the
+# high bits, chapter number in the low 16. Membership tests hash one int
+# instead of two strings, and checkpoints serialize to a flat int list
+BOOK_TO_ID = {book: i for i, book in enumerate(BOOK_NAMES)}
+
+
+def pack_chapter(book: str, chapter: str) -> int:
+    """Pack a (book, chapter) pair into a single int code."""
+    return (BOOK_TO_ID.setdefault(book, len(BOOK_TO_ID)) << 16) | int(chapter)
+
+
+# Verse prompt template, partially evaluated as inputs freeze: the persona
+# prefix is rendered once per run, the "{book} {chapter}:" reference prefix
+# once per chapter, leaving only a string concat per verse
+VERSE_PROMPT_PREFIX = "You are {persona}. Rewrite this single verse of the Bible in your voice:\n\n"
+VERSE_PROMPT_SUFFIX = "\n\nReturn only the translated verse:"
+
+
 class BibleChapterOrchestrator:
     """Orchestrates the translation of Bible chapters with intelligent token management."""
-    
+
+    # Coalesce DynamoDB writes across chapters; flushed at this size, on
+    # checkpoint boundaries, and at the end of the run
+    WRITE_BUFFER_FLUSH = 100
+
     def __init__(self, model_id: str = "us.deepseek.r1-v1:0", max_tokens: int = 4000):
         """
         Initialize the orchestrator.
@@ -48,7 +95,11 @@ class BibleChapterOrchestrator:
         self.dynamodb_loader = DynamoDBLoader()
         self.cost_calculator = CostCalculator()
         
-        # Translation statistics
+        # Translation statistics (updated from worker threads under the lock)
+        self.stats_lock = threading.Lock()
+        # Orders delta-log appends (main thread) against truncation by the
+        # checkpoint-writer thread
+        self._delta_lock = threading.Lock()
         self.stats = {
             'chapters_translated': 0,
             'verses_translated': 0,
@@ -59,14 +110,54 @@ class BibleChapterOrchestrator:
             'verse_translations': 0
         }
     
-    def load_bible_data(self, bible_file: str) -> Dict[str, Any]:
-        """Load Bible data from JSON file."""
+    def load_bible_data(self, bible_file: str, book: Optional[str] = None,
+                        chapter: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Load Bible data from JSON file.
+
+        With a book (and optionally chapter) filter, only that subtree is
+        stream-parsed via ijson instead of materializing the whole Bible;
+        full loads use orjson's C parser when available.
+
+        Args:
+            bible_file: Path to the Bible JSON file
+            book: Optional book name to load in isolation
+            chapter: Optional chapter number to load in isolation
+
+        Returns:
+            Bible data dictionary (possibly just the filtered subtree)
+        """
         try:
-            with open(bible_file, 'r') as f:
-                return json.load(f)
+            if book:
+                import ijson
+
+                prefix = f"{book}.{chapter}" if chapter else book
+                with open(bible_file, 'rb') as f:
+                    for subtree in ijson.items(f, prefix):
+                        if chapter:
+                            return {book: {chapter: subtree}}
+                        return self._intern_keys({book: subtree})
+                return {}
+
+            return self._intern_keys(_loads(Path(bible_file).read_bytes()))
         except Exception as e:
             logger.error(f"❌ Error loading Bible data: {e}")
             raise
+
+    @staticmethod
+    def _intern_keys(bible_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Intern book and chapter key strings.
+
+        The same book/chapter strings get copied into chapter lists,
+        checkpoint entries, DynamoDB keys, and log lines; interning makes
+        all of those share one string object (and speeds up the dict
+        lookups that compare them).
+        """
+        return {
+            sys.intern(book): {sys.intern(chapter): verses for chapter, verses in chapters.items()}
+            for book, chapters in bible_data.items()
+        }
     
     def get_chapter_list(self, bible_data: Dict[str, Any], book_filter: Optional[str] = None, 
                         chapter_filter: Optional[str] = None) -> List[tuple]:
@@ -79,21 +170,28 @@ class BibleChapterOrchestrator:
             chapter_filter: Optional chapter number filter
             
         Returns:
-            List of (book, chapter) tuples
+            List of (book, chapter) tuples in canonical Bible order
         """
+        # Filters are dict keys, so look them up directly instead of
+        # scanning every book and chapter against them
+        if book_filter:
+            book_chapters = bible_data.get(book_filter, {})
+            if chapter_filter:
+                return [(book_filter, chapter_filter)] if chapter_filter in book_chapters else []
+            return [(book_filter, chapter) for chapter in book_chapters]
+
         chapters = []
-        
         for book in bible_data:
-            if book_filter and book != book_filter:
-                continue
-                
             for chapter in bible_data[book]:
                 if chapter_filter and chapter != chapter_filter:
                     continue
-                    
+
                 chapters.append((book, chapter))
-        
-        return sorted(chapters)
+
+        # The source JSON is already in canonical order and dicts preserve
+        # insertion order; lexically sorting here both wasted an O(n log n)
+        # pass and misordered chapters ("10" < "2") and books (alphabetical)
+        return chapters
     
     def estimate_translation_cost(self, bible_data: Dict[str, Any], chapters: List[tuple], persona: str) -> Dict[str, Any]:
         """
@@ -110,25 +208,24 @@ class BibleChapterOrchestrator:
         total_input_tokens = 0
         total_output_tokens = 0
         chapter_methods = {}
-        
-        for book, chapter in chapters:
-            verses = bible_data[book][chapter]
-            
-            if self.chapter_translator.should_translate_chapter(book, chapter, verses, persona):
-                # Chapter translation
-                input_tokens, output_tokens = self.chapter_translator.estimate_chapter_tokens(book, chapter, verses, persona)
-                chapter_methods[(book, chapter)] = 'chapter'
-            else:
-                # Verse-by-verse translation
-                input_tokens = 0
-                output_tokens = 0
-                for verse_num, verse_text in verses.items():
-                    # Rough estimation for verse prompts
-                    verse_prompt = f"You are {persona}. Rewrite this single verse of the Bible in your voice:\n\n{book} {chapter}:{verse_num} - {verse_text}\n\nReturn only the translated verse:"
-                    input_tokens += self.chapter_translator.count_tokens(verse_prompt)
-                    output_tokens += self.chapter_translator.count_tokens(verse_text) * 1.2  # Estimate 20% longer
-                chapter_methods[(book, chapter)] = 'verse'
-            
+
+        # The persona prefix and instruction suffix are identical for
+        # every verse, so tokenize them once and add per verse
+        prefix = VERSE_PROMPT_PREFIX.format(persona=persona)
+        base_tokens = (self.chapter_translator.count_tokens(prefix)
+                       + self.chapter_translator.count_tokens(VERSE_PROMPT_SUFFIX))
+
+        # Estimation is tokenizer-bound and tiktoken releases the GIL, so
+        # chapters are estimated in parallel across a thread pool
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(
+                lambda bc: self._estimate_one_chapter(bc[0], bc[1], bible_data[bc[0]][bc[1]],
+                                                      persona, base_tokens),
+                chapters
+            )
+
+        for book, chapter, method, input_tokens, output_tokens in results:
+            chapter_methods[(book, chapter)] = method
             total_input_tokens += input_tokens
             total_output_tokens += output_tokens
         
@@ -142,119 +239,352 @@ class BibleChapterOrchestrator:
             'chapter_methods': chapter_methods,
             'num_chapters': len(chapters)
         }
+
+    def _estimate_one_chapter(self, book: str, chapter: str, verses: Dict[str, str],
+                              persona: str, base_tokens: int) -> tuple:
+        """
+        Estimate tokens for one chapter (estimation worker body).
+
+        Args:
+            book: Bible book name
+            chapter: Chapter number
+            verses: Verse dictionary for the chapter
+            persona: Persona name for translation
+            base_tokens: Precomputed tokens of the fixed verse-prompt
+                prefix and suffix
+
+        Returns:
+            Tuple of (book, chapter, method, input_tokens, output_tokens)
+        """
+        if self.chapter_translator.should_translate_chapter(book, chapter, verses, persona):
+            input_tokens, output_tokens = self.chapter_translator.estimate_chapter_tokens(
+                book, chapter, verses, persona)
+            return book, chapter, 'chapter', input_tokens, output_tokens
+
+        # Verse-by-verse translation — tokenize only the variable part of
+        # each prompt, in one batch for the chapter
+        ref_prefix = f"{book} {chapter}:"
+        verse_prompts = [f"{ref_prefix}{verse_num} - {verse_text}"
+                         for verse_num, verse_text in verses.items()]
+        input_tokens = base_tokens * len(verse_prompts)
+        input_tokens += sum(self.chapter_translator.count_tokens_batch(verse_prompts))
+        # Output is an estimate anyway — the char/4 heuristic is close
+        # enough without a second tokenizer pass
+        output_tokens = sum(int(_approx_tokens(verse_text) * 1.2)
+                            for verse_text in verses.values())
+        return book, chapter, 'verse', input_tokens, output_tokens
     
-    def translate_chapters(self, bible_data: Dict[str, Any], chapters: List[tuple], persona: str, 
-                          checkpoint_file: Optional[str] = None, batch_size: int = 10) -> Dict[str, Any]:
+    def translate_chapters(self, bible_data: Dict[str, Any], chapters: List[tuple], persona: str,
+                          checkpoint_file: Optional[str] = None, batch_size: int = 10,
+                          concurrency: int = 8,
+                          chapter_methods: Optional[Dict[tuple, str]] = None) -> Dict[str, Any]:
         """
-        Translate the specified chapters.
-        
+        Translate the specified chapters with bounded parallelism.
+
+        Chapter jobs run in a ThreadPoolExecutor — the work is Bedrock
+        round-trips, so wall time scales with the worker count rather than
+        the sum of per-call latencies.
+
         Args:
             bible_data: Loaded Bible data
             chapters: List of (book, chapter) tuples
             persona: Persona name for translation
             checkpoint_file: Optional checkpoint file for resume
             batch_size: Number of chapters to process before saving checkpoint
-            
+            concurrency: Maximum chapters translated in parallel
+            chapter_methods: Optional per-chapter method dispatch table from
+                estimate_translation_cost, reused to skip re-tokenizing
+                every chapter for the chapter-vs-verse decision
+
         Returns:
             Translation statistics
         """
         # Load checkpoint if provided
         completed_chapters = set()
-        if checkpoint_file and Path(checkpoint_file).exists():
-            with open(checkpoint_file, 'r') as f:
-                checkpoint_data = json.load(f)
-                completed_chapters = set(checkpoint_data.get('completed_chapters', []))
-                self.stats = checkpoint_data.get('stats', self.stats)
+        if checkpoint_file:
+            completed_chapters = self._load_checkpoint(checkpoint_file)
+            if completed_chapters:
                 logger.info(f"📋 Loaded checkpoint: {len(completed_chapters)} chapters completed")
-        
+
         # Filter out completed chapters
-        remaining_chapters = [(book, chapter) for book, chapter in chapters 
-                             if (book, chapter) not in completed_chapters]
-        
-        logger.info(f"🎯 Starting translation of {len(remaining_chapters)} chapters as {persona}")
-        
-        for i, (book, chapter) in enumerate(remaining_chapters):
-            try:
-                logger.info(f"📖 Processing {book} {chapter} ({i+1}/{len(remaining_chapters)})")
-                
-                verses = bible_data[book][chapter]
-                
-                # Determine translation method
-                if self.chapter_translator.should_translate_chapter(book, chapter, verses, persona):
-                    # Chapter translation
-                    result = self.chapter_translator.translate_chapter(book, chapter, verses, persona)
-                    if result:
-                        dynamodb_items = self.chapter_translator.save_chapter_translation(book, chapter, result, persona)
-                        self.stats['chapters_translated'] += 1
-                        self.stats['verses_translated'] += len(result)
-                        self.stats['chapter_translations'] += 1
-                        
-                        # Save to DynamoDB
-                        self.dynamodb_loader.batch_write_items(dynamodb_items)
-                        logger.info(f"✅ Chapter {book} {chapter} translated successfully")
-                    else:
-                        self.stats['chapters_failed'] += 1
-                        logger.error(f"❌ Chapter {book} {chapter} translation failed")
-                        continue
-                else:
-                    # Verse-by-verse translation
-                    logger.info(f"🔄 Using verse-by-verse translation for {book} {chapter}")
-                    results = {}
-                    for verse_num, verse_text in verses.items():
-                        translated = self.verse_translator.translate_verse(book, chapter, verse_num, verse_text, persona)
-                        if translated:
-                            results[verse_num] = translated
-                            self.stats['verses_translated'] += 1
-                        else:
-                            self.stats['verses_failed'] += 1
-                        
-                        time.sleep(0.1)  # Small delay to avoid rate limiting
-                    
-                    if results:
-                        dynamodb_items = self.chapter_translator.save_chapter_translation(book, chapter, results, persona)
-                        self.stats['chapters_translated'] += 1
-                        self.stats['verse_translations'] += 1
-                        
-                        # Save to DynamoDB
-                        self.dynamodb_loader.batch_write_items(dynamodb_items)
-                        logger.info(f"✅ Verse-by-verse translation complete for {book} {chapter}")
-                    else:
-                        self.stats['chapters_failed'] += 1
-                        logger.error(f"❌ Verse-by-verse translation failed for {book} {chapter}")
-                        continue
-                
-                # Mark as completed
-                completed_chapters.add((book, chapter))
-                
-                # Save checkpoint every batch_size chapters
-                if (i + 1) % batch_size == 0 and checkpoint_file:
-                    self._save_checkpoint(checkpoint_file, completed_chapters)
-                    logger.info(f"💾 Checkpoint saved after {i + 1} chapters")
-                
-                # Small delay between chapters
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"❌ Error processing {book} {chapter}: {e}")
-                self.stats['chapters_failed'] += 1
-                continue
-        
-        # Final checkpoint save
+        remaining_chapters = [(book, chapter) for book, chapter in chapters
+                             if pack_chapter(book, chapter) not in completed_chapters]
+
+        # Group same-method chapters together (stable, keeps canonical
+        # order within a group) so consecutive requests share the same
+        # prompt shape and persona system prompt
+        if chapter_methods:
+            remaining_chapters.sort(key=lambda bc: chapter_methods.get(bc) != 'chapter')
+            chapter_count = sum(1 for bc in remaining_chapters if chapter_methods.get(bc) == 'chapter')
+            logger.info(f"📦 Grouped {chapter_count} chapter-method and "
+                        f"{len(remaining_chapters) - chapter_count} verse-method chapters")
+
+        logger.info(f"🎯 Starting translation of {len(remaining_chapters)} chapters as {persona} "
+                    f"({concurrency} workers)")
+
+        write_buffer = []
+        # Chapters whose items sit in write_buffer — their delta lines are
+        # written only once those items have reached DynamoDB
+        buffered_chapters = []
+        # Append-only delta log: completed chapters cost one fsync'd line
+        # each instead of rewriting the whole snapshot O(n) times
+        delta_log = open(self._delta_file(checkpoint_file), 'ab') if checkpoint_file else None
+
+        # Snapshot writes happen on a background thread so fsync never
+        # blocks the translation loop; losing an in-flight snapshot on
+        # crash is fine because the delta log still has every chapter
+        ckpt_queue = None
+        ckpt_writer = None
         if checkpoint_file:
-            self._save_checkpoint(checkpoint_file, completed_chapters)
-        
+            ckpt_queue = queue.Queue(maxsize=2)
+            ckpt_writer = threading.Thread(
+                target=self._checkpoint_writer, args=(checkpoint_file, ckpt_queue, delta_log),
+                daemon=True
+            )
+            ckpt_writer.start()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(self._translate_one, bible_data, book, chapter, persona,
+                                chapter_methods): (book, chapter)
+                for book, chapter in remaining_chapters
+            }
+
+            done_count = 0
+            for future in as_completed(futures):
+                book, chapter = futures[future]
+                done_count += 1
+
+                try:
+                    stats_delta, dynamodb_items = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Error processing {book} {chapter}: {e}")
+                    with self.stats_lock:
+                        self.stats['chapters_failed'] += 1
+                    continue
+
+                with self.stats_lock:
+                    for key, delta in stats_delta.items():
+                        self.stats[key] += delta
+
+                if dynamodb_items:
+                    # Buffer writes so many small chapters share one
+                    # BatchWriteItem round of requests. The chapter's delta
+                    # line is deferred until the flush that covers its items
+                    # returns — the log must never claim unwritten work
+                    write_buffer.extend(dynamodb_items)
+                    completed_chapters.add(pack_chapter(book, chapter))
+                    buffered_chapters.append(pack_chapter(book, chapter))
+                    logger.info(f"✅ {book} {chapter} complete ({done_count}/{len(remaining_chapters)})")
+
+                if len(write_buffer) >= self.WRITE_BUFFER_FLUSH:
+                    write_buffer, buffered_chapters = self._flush_writes(
+                        write_buffer, buffered_chapters, delta_log)
+
+                # Save checkpoint every batch_size chapters; flush pending
+                # writes first so the checkpoint never claims unwritten work
+                if done_count % batch_size == 0 and ckpt_queue:
+                    write_buffer, buffered_chapters = self._flush_writes(
+                        write_buffer, buffered_chapters, delta_log)
+                    # Capture the snapshot and the delta-log offset it covers
+                    # under the same lock as the appends, so the writer never
+                    # truncates entries the snapshot missed
+                    with self._delta_lock:
+                        payload = (completed_chapters.copy(), delta_log.tell())
+                    try:
+                        # Skip if the writer is behind — the next snapshot
+                        # includes these chapters anyway
+                        ckpt_queue.put_nowait(payload)
+                        logger.info(f"💾 Checkpoint queued after {done_count} chapters")
+                    except queue.Full:
+                        pass
+
+        # Flush remaining writes and save the final checkpoint
+        try:
+            self._flush_writes(write_buffer, buffered_chapters, delta_log)
+            if ckpt_queue:
+                with self._delta_lock:
+                    payload = (completed_chapters.copy(), delta_log.tell())
+                ckpt_queue.put(payload)
+        finally:
+            if ckpt_queue:
+                ckpt_queue.put(None)
+                ckpt_writer.join()
+            if delta_log:
+                delta_log.close()
+
         return self.stats
+
+    def _flush_writes(self, write_buffer: list, buffered_chapters: list, delta_log) -> tuple:
+        """
+        Flush buffered items to DynamoDB, then log their chapters as done.
+
+        The delta lines go to disk only after batch_write_items has
+        returned, so a crash between translation and flush re-translates
+        the chapter instead of resuming past verses that never landed.
+
+        Args:
+            write_buffer: Pending DynamoDB items
+            buffered_chapters: Packed chapter codes covered by write_buffer
+            delta_log: Open delta-log file, or None without checkpointing
+
+        Returns:
+            Tuple of fresh (write_buffer, buffered_chapters) lists
+        """
+        self.dynamodb_loader.batch_write_items(write_buffer)
+
+        if delta_log and buffered_chapters:
+            with self._delta_lock:
+                delta_log.write(b"".join(_dumps_line(code) for code in buffered_chapters))
+                delta_log.flush()
+                os.fsync(delta_log.fileno())
+
+        return [], []
+
+    def _checkpoint_writer(self, checkpoint_file: str, ckpt_queue: "queue.Queue", delta_log) -> None:
+        """Drain queued completed-chapter snapshots to disk (daemon thread)."""
+        while True:
+            payload = ckpt_queue.get()
+            if payload is None:
+                return
+            snapshot, delta_offset = payload
+            self._save_checkpoint(checkpoint_file, snapshot)
+
+            # Truncate the delta log only if nothing was appended after the
+            # snapshot was captured; otherwise leave it — duplicate entries
+            # are harmless on resume (set union) and the next quiet snapshot
+            # clears the log
+            with self._delta_lock:
+                if delta_log.tell() == delta_offset:
+                    delta_log.seek(0)
+                    delta_log.truncate()
+
+    def _translate_one(self, bible_data: Dict[str, Any], book: str, chapter: str,
+                       persona: str, chapter_methods: Optional[Dict[tuple, str]] = None) -> tuple:
+        """
+        Translate a single chapter (worker-thread body).
+
+        Args:
+            bible_data: Loaded Bible data
+            book: Bible book name
+            chapter: Chapter number
+            persona: Persona name for translation
+            chapter_methods: Optional precomputed method dispatch table
+
+        Returns:
+            Tuple of (stats_delta, dynamodb_items)
+        """
+        verses = bible_data[book][chapter]
+        stats_delta = {
+            'chapters_translated': 0,
+            'verses_translated': 0,
+            'chapters_failed': 0,
+            'verses_failed': 0,
+            'chapter_translations': 0,
+            'verse_translations': 0
+        }
+        dynamodb_items = []
+
+        # Determine translation method — prefer the decision already made
+        # during cost estimation over re-tokenizing the chapter
+        if chapter_methods and (book, chapter) in chapter_methods:
+            use_chapter = chapter_methods[(book, chapter)] == 'chapter'
+        else:
+            use_chapter = self.chapter_translator.should_translate_chapter(book, chapter, verses, persona)
+
+        if use_chapter:
+            # Chapter translation
+            result = self.chapter_translator.translate_chapter(book, chapter, verses, persona)
+            if result:
+                dynamodb_items = self.chapter_translator.save_chapter_translation(book, chapter, result, persona)
+                stats_delta['chapters_translated'] += 1
+                stats_delta['verses_translated'] += len(result)
+                stats_delta['chapter_translations'] += 1
+            else:
+                stats_delta['chapters_failed'] += 1
+                logger.error(f"❌ Chapter {book} {chapter} translation failed")
+        else:
+            # Batched verse translation — a few multi-verse calls
+            # instead of one round-trip (plus sleep) per verse
+            logger.info(f"🔄 Using batched verse translation for {book} {chapter}")
+            results = self.verse_translator.translate_verses_batch(book, chapter, verses, persona)
+            stats_delta['verses_translated'] += len(results)
+            stats_delta['verses_failed'] += len(verses) - len(results)
+
+            if results:
+                dynamodb_items = self.chapter_translator.save_chapter_translation(book, chapter, results, persona)
+                stats_delta['chapters_translated'] += 1
+                stats_delta['verse_translations'] += 1
+            else:
+                stats_delta['chapters_failed'] += 1
+                logger.error(f"❌ Verse-by-verse translation failed for {book} {chapter}")
+
+        return stats_delta, dynamodb_items
     
+    @staticmethod
+    def _delta_file(checkpoint_file: str) -> str:
+        """Path of the append-only delta log next to a checkpoint file."""
+        return f"{checkpoint_file}.jsonl"
+
+    def _load_checkpoint(self, checkpoint_file: str) -> set:
+        """
+        Load completed chapters from the snapshot plus the delta log.
+
+        Chapters finished after the last compact snapshot live only in the
+        delta log, so both are merged on resume. Entries from checkpoints
+        written before the packed-int format ([book, chapter] lists) are
+        converted on the fly.
+
+        Args:
+            checkpoint_file: Checkpoint snapshot path
+
+        Returns:
+            Set of packed (book, chapter) int codes
+        """
+        completed_chapters = set()
+
+        if Path(checkpoint_file).exists():
+            checkpoint_data = _loads(Path(checkpoint_file).read_bytes())
+            for entry in checkpoint_data.get('completed_chapters', []):
+                completed_chapters.add(entry if isinstance(entry, int) else pack_chapter(*entry))
+            self.stats = checkpoint_data.get('stats', self.stats)
+
+        delta_file = self._delta_file(checkpoint_file)
+        if Path(delta_file).exists():
+            with open(delta_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        delta = _loads(line)
+                        completed_chapters.add(
+                            delta if isinstance(delta, int) else pack_chapter(delta['book'], delta['chapter'])
+                        )
+
+        return completed_chapters
+
     def _save_checkpoint(self, checkpoint_file: str, completed_chapters: set) -> None:
-        """Save checkpoint data."""
+        """
+        Save a compact checkpoint snapshot atomically.
+
+        The snapshot is written to a temp file and os.replace'd into place
+        so a crash mid-write can never leave a torn checkpoint. Truncating
+        the delta log is the caller's job — it must be ordered against
+        concurrent appends (see _checkpoint_writer).
+        """
         checkpoint_data = {
-            'completed_chapters': list(completed_chapters),
+            'completed_chapters': sorted(completed_chapters),
             'stats': self.stats,
             'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ')
         }
-        
-        with open(checkpoint_file, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2)
+
+        tmp_file = f"{checkpoint_file}.tmp"
+        if orjson is not None:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(checkpoint_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_file, 'w') as f:
+                json.dump(checkpoint_data, f, indent=2)
+        os.replace(tmp_file, checkpoint_file)
     
     def print_summary(self, stats: Dict[str, Any], cost_estimate: Dict[str, Any]) -> None:
         """Print translation summary."""
@@ -284,6 +614,7 @@ def main():
     parser.add_argument("--max-tokens", type=int, default=4000, help="Maximum tokens for model")
     parser.add_argument("--checkpoint", help="Checkpoint file for resume capability")
     parser.add_argument("--batch-size", type=int, default=10, help="Chapters per checkpoint")
+    parser.add_argument("--concurrency", type=int, default=8, help="Chapters translated in parallel")
     parser.add_argument("--estimate-only", action="store_true", help="Only estimate cost, don't translate")
     
     args = parser.parse_args()
@@ -294,7 +625,7 @@ def main():
     try:
         # Load Bible data
         logger.info(f"📚 Loading Bible data from {args.bible_file}")
-        bible_data = orchestrator.load_bible_data(args.bible_file)
+        bible_data = orchestrator.load_bible_data(args.bible_file, args.book, args.chapter)
         
         # Get chapter list
         chapters = orchestrator.get_chapter_list(bible_data, args.book, args.chapter)
@@ -328,7 +659,9 @@ def main():
         
         # Start translation
         logger.info("🚀 Starting translation...")
-        stats = orchestrator.translate_chapters(bible_data, chapters, args.persona, args.checkpoint, args.batch_size)
+        stats = orchestrator.translate_chapters(bible_data, chapters, args.persona, args.checkpoint,
+                                                args.batch_size, args.concurrency,
+                                                cost_estimate['chapter_methods'])
         
         # Print summary
         orchestrator.print_summary(stats, cost_estimate)
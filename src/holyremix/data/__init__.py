@@ -0,0 +1 @@
+# Static Data Package
@@ -12,6 +12,24 @@ import sys
 from typing import Dict, Any
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+# Shared session so successive download attempts reuse one pooled
+# connection (keepalive skips repeat TLS handshakes) and retry transient
+# server errors with backoff instead of failing over to the next source
+_session = requests.Session()
+_session.mount("https://", requests.adapters.HTTPAdapter(
+    max_retries=requests.adapters.Retry(
+        total=3, backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+))
+
 
 def download_kjv_data() -> Dict[str, Any]:
     """
@@ -27,8 +45,7 @@ def download_kjv_data() -> Dict[str, Any]:
         if Path(local_file).exists():
             print(f"📖 Using local file: {local_file}")
             try:
-                with open(local_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = _loads(Path(local_file).read_bytes())
                 print(f"✅ Successfully loaded {len(data)} entries from {local_file}")
                 return data
             except Exception as e:
@@ -47,9 +64,9 @@ def download_kjv_data() -> Dict[str, Any]:
     for i, url in enumerate(sources, 1):
         try:
             print(f"   Trying source {i}/{len(sources)}...")
-            response = requests.get(url, timeout=30)
+            response = _session.get(url, timeout=30)
             response.raise_for_status()
-            data = response.json()
+            data = _loads(response.content)
             
             # Check if this looks like Bible data
             if isinstance(data, list) and len(data) > 0:
@@ -109,80 +126,72 @@ def restructure_kjv_data(raw_data: Dict[str, Any]) -> Dict[str, Any]:
         Restructured data in format: {book: {chapter: {verse: text}}}
     """
     print("🔄 Restructuring KJV data...")
-    
-    restructured = {}
-    
-    # Handle different data formats
+
+    # Dispatch on the format once, then run a tight loop specialized for
+    # it — the flat formats iterate ~31k entries, so per-entry isinstance
+    # checks and repeated global lookups add up
     if isinstance(raw_data, list):
-        # Direct list of verses (original format)
-        for entry in raw_data:
-            if isinstance(entry, dict):
-                book = entry.get('book', '').strip()
-                chapter = str(entry.get('chapter', ''))
-                verse = str(entry.get('verse', ''))
-                text = entry.get('text', '').strip()
-                
-                if not all([book, chapter, verse, text]):
-                    continue
-                    
-                # Initialize book if it doesn't exist
-                if book not in restructured:
-                    restructured[book] = {}
-                    
-                # Initialize chapter if it doesn't exist
-                if chapter not in restructured[book]:
-                    restructured[book][chapter] = {}
-                    
-                # Add verse
-                restructured[book][chapter][verse] = text
-    
-    elif isinstance(raw_data, dict):
-        # Handle nested dictionary format
+        return _restructure_flat_list(raw_data)
+
+    if isinstance(raw_data, dict):
         if 'verses' in raw_data:
-            # API format with verses array
-            for entry in raw_data['verses']:
-                book = entry.get('book', '').strip()
-                chapter = str(entry.get('chapter', ''))
-                verse = str(entry.get('verse', ''))
-                text = entry.get('text', '').strip()
-                
-                if not all([book, chapter, verse, text]):
-                    continue
-                    
-                if book not in restructured:
-                    restructured[book] = {}
-                if chapter not in restructured[book]:
-                    restructured[book][chapter] = {}
-                restructured[book][chapter][verse] = text
-        
-        elif 'books' in raw_data:
-            # BBE format with books/chapters/verses structure
-            print(f"📚 Processing {len(raw_data['books'])} books in BBE format...")
-            
-            for book_data in raw_data['books']:
-                book_name = book_data.get('name', '').strip()
-                if not book_name:
-                    continue
-                
-                print(f"   📖 Processing book: {book_name}")
-                restructured[book_name] = {}
-                
-                chapters = book_data.get('chapters', [])
-                for chapter_data in chapters:
-                    chapter_num = str(chapter_data.get('chapter', ''))
-                    if not chapter_num:
-                        continue
-                    
-                    restructured[book_name][chapter_num] = {}
-                    
-                    verses = chapter_data.get('verses', [])
-                    for verse_data in verses:
-                        verse_num = str(verse_data.get('verse', ''))
-                        verse_text = verse_data.get('text', '').strip()
-                        
-                        if verse_num and verse_text:
-                            restructured[book_name][chapter_num][verse_num] = verse_text
-    
+            return _restructure_flat_list(raw_data['verses'])
+        if 'books' in raw_data:
+            return _restructure_bbe_books(raw_data['books'])
+
+    return {}
+
+
+def _restructure_flat_list(entries) -> Dict[str, Any]:
+    """Restructure a flat list of verse entries (original and API formats)."""
+    restructured = {}
+    setdefault = restructured.setdefault
+
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+
+        get = entry.get
+        book = get('book', '').strip()
+        chapter = str(get('chapter', ''))
+        verse = str(get('verse', ''))
+        text = get('text', '').strip()
+
+        if not (book and chapter and verse and text):
+            continue
+
+        setdefault(book, {}).setdefault(chapter, {})[verse] = text
+
+    return restructured
+
+
+def _restructure_bbe_books(books) -> Dict[str, Any]:
+    """Restructure the BBE books/chapters/verses format."""
+    restructured = {}
+    print(f"📚 Processing {len(books)} books in BBE format...")
+
+    for book_data in books:
+        book_name = book_data.get('name', '').strip()
+        if not book_name:
+            continue
+
+        print(f"   📖 Processing book: {book_name}")
+        book_dict = restructured[book_name] = {}
+
+        for chapter_data in book_data.get('chapters', []):
+            chapter_num = str(chapter_data.get('chapter', ''))
+            if not chapter_num:
+                continue
+
+            chapter_dict = book_dict[chapter_num] = {}
+
+            for verse_data in chapter_data.get('verses', []):
+                verse_num = str(verse_data.get('verse', ''))
+                verse_text = verse_data.get('text', '').strip()
+
+                if verse_num and verse_text:
+                    chapter_dict[verse_num] = verse_text
+
     return restructured
 
 
@@ -195,16 +204,68 @@ def save_restructured_data(data: Dict[str, Any], output_file: str = "tests/fixtu
         output_file: Output file path
     """
     print(f"💾 Saving restructured data to {output_file}...")
-    
+
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # orjson serializes the ~31k verse dicts in C, an order of
+            # magnitude faster than json.dump with indent=2
+            Path(output_file).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            )
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         print(f"✅ Successfully saved {output_file}")
     except IOError as e:
         print(f"❌ Error saving file: {e}")
         sys.exit(1)
 
 
+def save_columnar_data(data: Dict[str, Any], output_file: str = "tests/fixtures/kjv_bible.parquet") -> None:
+    """
+    Save a columnar (struct-of-arrays) Parquet copy of the Bible.
+
+    Columns are (book_id, chapter, verse, text) with a JSON sidecar mapping
+    book_id back to book names — roughly 4x smaller than the nested JSON
+    and loadable without allocating one dict per chapter. Skipped silently
+    when pyarrow isn't installed; the nested JSON stays the canonical
+    interchange format.
+
+    Args:
+        data: Restructured KJV data
+        output_file: Output Parquet file path
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return
+
+    book_names = list(data)
+    book_ids, chapters, verses, texts = [], [], [], []
+    for book_id, book in enumerate(book_names):
+        for chapter, chapter_verses in data[book].items():
+            for verse, text in chapter_verses.items():
+                book_ids.append(book_id)
+                chapters.append(int(chapter))
+                verses.append(int(verse))
+                texts.append(text)
+
+    table = pa.table({
+        'book_id': pa.array(book_ids, type=pa.uint8()),
+        'chapter': pa.array(chapters, type=pa.uint16()),
+        'verse': pa.array(verses, type=pa.uint16()),
+        'text': pa.array(texts, type=pa.string()),
+    })
+    pq.write_table(table, output_file, compression='zstd')
+
+    sidecar = Path(output_file).with_suffix('.books.json')
+    with open(sidecar, 'w', encoding='utf-8') as f:
+        json.dump(book_names, f)
+
+    print(f"📦 Saved columnar copy to {output_file}")
+
+
 def validate_restructured_data(data: Dict[str, Any]) -> None:
     """
     Validate the restructured data for completeness.
@@ -237,24 +298,53 @@ def validate_restructured_data(data: Dict[str, Any]) -> None:
         print("✅ All expected books found")
 
 
-def main():
-    """Main function to orchestrate the KJV preprocessing."""
-    print("🎭 HOLY REMIX - KJV Preprocessor")
-    print("=" * 40)
-    
-    # Download raw data
-    raw_data = download_kjv_data()
-    print(f"📥 Downloaded {len(raw_data)} entries")
-    
+def preprocess(input_path: str = None, output_path: str = "tests/fixtures/kjv_bible.json") -> Dict[str, Any]:
+    """
+    Preprocess a JSON Bible into the nested dictionary format.
+
+    Callable directly (no argparse round-trip) so wrapper scripts can invoke
+    it in-process.
+
+    Args:
+        input_path: Optional path to a local JSON Bible file; if None, uses
+            the usual local-file/download discovery
+        output_path: Output JSON file path
+
+    Returns:
+        Restructured data in format: {book: {chapter: {verse: text}}}
+    """
+    if input_path:
+        print(f"📖 Using input file: {input_path}")
+        try:
+            raw_data = _loads(Path(input_path).read_bytes())
+        except (IOError, ValueError) as e:
+            print(f"❌ Error reading {input_path}: {e}")
+            sys.exit(1)
+    else:
+        raw_data = download_kjv_data()
+
+    print(f"📥 Loaded {len(raw_data)} entries")
+
     # Restructure data
     restructured_data = restructure_kjv_data(raw_data)
-    
+
     # Validate data
     validate_restructured_data(restructured_data)
-    
-    # Save to file
-    save_restructured_data(restructured_data)
-    
+
+    # Save to file (plus a columnar Parquet copy when pyarrow is available)
+    save_restructured_data(restructured_data, output_path)
+    save_columnar_data(restructured_data, str(Path(output_path).with_suffix('.parquet')))
+
+    return restructured_data
+
+
+def main():
+    """Main function to orchestrate the KJV preprocessing."""
+    print("🎭 HOLY REMIX - KJV Preprocessor")
+    print("=" * 40)
+
+    preprocess()
+
     print("\n🎉 KJV preprocessing complete!")
     print("�� Output file: tests/fixtures/kjv_bible.json")
     print("🚀 Ready for AI translation!")
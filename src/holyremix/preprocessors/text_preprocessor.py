@@ -7,105 +7,119 @@ to the nested dictionary format needed for AI translation and DynamoDB storage.
 """
 
 import json
+import mmap
 import re
 import sys
 from typing import Dict, Any
 from pathlib import Path
 
+# orjson serializes several times faster than stdlib json and writes
+# bytes directly; fall back to json.dump when it is not installed
+try:
+    import orjson
 
-def parse_text_bible(file_path: str) -> Dict[str, Any]:
+    def _dump_json(data: Dict[str, Any], output_file: str) -> None:
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+except ImportError:
+    orjson = None
+
+    def _dump_json(data: Dict[str, Any], output_file: str) -> None:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+# One combined multiline pattern for the whole file — a single C-level
+# finditer scan replaces the Python-level split/strip/match-per-line loop.
+# Alternatives, in match order: "##"/"###" book headers, "[1:1]" bracket
+# verses, and the "1:1" / "1.1" / "Verse 1:1" fallback formats. Compiled
+# over bytes so it can run directly on the mmap'd file without decoding
+# the whole buffer to str first
+_LINE_RE = re.compile(
+    rb'(?m)^[ \t]*(?:'
+    rb'#{2,}[ \t]*(?P<book>\S.*?)'
+    rb'|\[(?P<ch>\d+):(?P<vs>\d+)\][ \t]*(?P<txt>\S.*?)'
+    rb'|(?:Verse[ \t]+)?(?P<fch>\d+)[:.](?P<fvs>\d+)[ \t]*(?P<ftxt>\S.*?)'
+    rb')[ \t\r]*$'
+)
+
+
+def parse_text_bible(file_path: str, verbose: bool = False) -> Dict[str, Any]:
     """
     Parse a plain text Bible file with verse markers like [1:1].
-    
+
+    A single finditer pass over the whole file replaces the old per-line
+    split/strip/match loop, keeping the scan in C.
+
     Args:
         file_path: Path to the text Bible file
-        
+        verbose: Print per-chapter progress (noisy on a full Bible)
+
     Returns:
         Restructured data in format: {book: {chapter: {verse: text}}}
     """
     print(f"📖 Parsing text Bible file: {file_path}")
-    
+
     restructured = {}
     current_book = None
     current_chapter = None
-    
+    book_chapters = None  # Chapters dict of current_book, bound once per book
+
+    # Memory-map the file and scan the raw bytes — only matched groups are
+    # ever decoded, so the full UTF-8 -> str copy of the buffer goes away
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
     except FileNotFoundError:
         print(f"❌ File not found: {file_path}")
         sys.exit(1)
+    except ValueError:
+        return restructured  # Empty file — nothing to map or parse
     except Exception as e:
         print(f"❌ Error reading file: {e}")
         sys.exit(1)
-    
-    # Split content into lines
-    lines = content.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Check if this is a book header (starts with ### or similar)
-        if line.startswith('###') or line.startswith('##'):
-            current_book = line.replace('#', '').strip()
+
+    for match in _LINE_RE.finditer(content):
+        # Pull every group in one C-level call instead of separate
+        # match.group() dispatches per branch
+        book, chapter_num, verse_num, verse_text, fch, fvs, ftxt = \
+            match.group('book', 'ch', 'vs', 'txt', 'fch', 'fvs', 'ftxt')
+
+        # Book header (starts with ### or ##)
+        if book is not None:
+            # Interned so the 31k verse inserts below compare the book key
+            # by pointer identity instead of re-hashing the characters
+            current_book = sys.intern(book.decode('utf-8').strip('# \t'))
             print(f"📚 Processing book: {current_book}")
-            restructured[current_book] = {}
+            book_chapters = restructured[current_book] = {}
             current_chapter = None
             continue
-        
-        # Check if this is a verse with marker like [1:1]
-        verse_match = re.match(r'\[(\d+):(\d+)\]\s*(.+)', line)
-        if verse_match:
-            chapter_num = verse_match.group(1)
-            verse_num = verse_match.group(2)
-            verse_text = verse_match.group(3).strip()
-            
-            # If we don't have a current book, try to infer from context
-            if not current_book:
-                current_book = "Unknown"
-                restructured[current_book] = {}
-            
-            # Initialize chapter if it doesn't exist
-            if chapter_num not in restructured[current_book]:
-                restructured[current_book][chapter_num] = {}
-                if current_chapter != chapter_num:
-                    print(f"   📖 Chapter {chapter_num}")
-                    current_chapter = chapter_num
-            
-            # Add verse
-            restructured[current_book][chapter_num][verse_num] = verse_text
-        
-        # Handle other formats - look for patterns like "1:1" or "1.1"
-        else:
-            # Try different verse patterns
-            patterns = [
-                r'(\d+):(\d+)\s*(.+)',  # 1:1 format
-                r'(\d+)\.(\d+)\s*(.+)',  # 1.1 format
-                r'Verse\s+(\d+):(\d+)\s*(.+)',  # Verse 1:1 format
-            ]
-            
-            for pattern in patterns:
-                match = re.match(pattern, line)
-                if match:
-                    chapter_num = match.group(1)
-                    verse_num = match.group(2)
-                    verse_text = match.group(3).strip()
-                    
-                    if not current_book:
-                        current_book = "Unknown"
-                        restructured[current_book] = {}
-                    
-                    if chapter_num not in restructured[current_book]:
-                        restructured[current_book][chapter_num] = {}
-                        if current_chapter != chapter_num:
-                            print(f"   📖 Chapter {chapter_num}")
-                            current_chapter = chapter_num
-                    
-                    restructured[current_book][chapter_num][verse_num] = verse_text
-                    break
-    
+
+        # Verse — either the "[1:1]" bracket groups or the fallback groups
+        # ("1:1", "1.1", "Verse 1:1") matched
+        if chapter_num is None:
+            chapter_num, verse_num, verse_text = fch, fvs, ftxt
+
+        # Chapter and verse numbers recur across the whole corpus — intern
+        # them so repeated keys share one string object each
+        chapter_num = sys.intern(chapter_num.decode('ascii'))
+        verse_num = sys.intern(verse_num.decode('ascii'))
+        verse_text = verse_text.decode('utf-8')
+
+        # If we don't have a current book, try to infer from context
+        if not current_book:
+            current_book = "Unknown"
+            book_chapters = restructured[current_book] = {}
+
+        if current_chapter != chapter_num:
+            if verbose:
+                print(f"   📖 Chapter {chapter_num}")
+            current_chapter = chapter_num
+
+        # Add verse — setdefault fuses the chapter membership check and
+        # insert into one hash probe
+        book_chapters.setdefault(chapter_num, {})[verse_num] = verse_text
+
+    content.close()
     return restructured
 
 
@@ -120,14 +134,32 @@ def save_restructured_data(data: Dict[str, Any], output_file: str = "tests/fixtu
     print(f"💾 Saving restructured data to {output_file}...")
     
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _dump_json(data, output_file)
         print(f"✅ Successfully saved {output_file}")
     except IOError as e:
         print(f"❌ Error saving file: {e}")
         sys.exit(1)
 
 
+def iter_verses(data: Dict[str, Any]):
+    """
+    Yield (book, chapter, verse, text) tuples from the nested Bible dict.
+
+    Flat access for consumers that stream verses (counting, DynamoDB
+    ingestion) without each building its own triple-nested loop.
+
+    Args:
+        data: Restructured Bible data
+
+    Yields:
+        (book, chapter, verse, text) tuples in document order
+    """
+    for book, chapters in data.items():
+        for chapter, verses in chapters.items():
+            for verse_num, verse_text in verses.items():
+                yield book, chapter, verse_num, verse_text
+
+
 def validate_restructured_data(data: Dict[str, Any]) -> None:
     """
     Validate the restructured data for completeness.
@@ -137,13 +169,14 @@ def validate_restructured_data(data: Dict[str, Any]) -> None:
     """
     print("🔍 Validating restructured data...")
     
+    # One walk of the nested dict covers all three totals
     total_books = len(data)
-    total_chapters = sum(len(chapters) for chapters in data.values())
-    total_verses = sum(
-        len(verses) 
-        for chapters in data.values() 
-        for verses in chapters.values()
-    )
+    total_chapters = 0
+    total_verses = 0
+    for chapters in data.values():
+        total_chapters += len(chapters)
+        for verses in chapters.values():
+            total_verses += len(verses)
     
     print(f"📊 Validation Results:")
     print(f"   Books: {total_books}")
@@ -160,28 +193,47 @@ def validate_restructured_data(data: Dict[str, Any]) -> None:
         print(f"   {data[first_book][first_chapter][first_verse]}")
 
 
+def preprocess(input_path: str, output_path: str = "tests/fixtures/kjv_bible.json") -> Dict[str, Any]:
+    """
+    Preprocess a text Bible file into the nested dictionary format.
+
+    Callable directly (no argparse round-trip) so wrapper scripts can invoke
+    it in-process.
+
+    Args:
+        input_path: Path to the text Bible file
+        output_path: Output JSON file path
+
+    Returns:
+        Restructured data in format: {book: {chapter: {verse: text}}}
+    """
+    # Parse the text Bible file
+    restructured_data = parse_text_bible(input_path)
+
+    # Validate data
+    validate_restructured_data(restructured_data)
+
+    # Save to file
+    save_restructured_data(restructured_data, output_path)
+
+    return restructured_data
+
+
 def main():
     """Main function to orchestrate the text Bible preprocessing."""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Text Bible Preprocessor")
     parser.add_argument("input_file", help="Path to the text Bible file")
     parser.add_argument("--output", default="tests/fixtures/kjv_bible.json", help="Output JSON file path")
-    
+
     args = parser.parse_args()
-    
+
     print("🎭 HOLY REMIX - Text Bible Preprocessor")
     print("=" * 40)
-    
-    # Parse the text Bible file
-    restructured_data = parse_text_bible(args.input_file)
-    
-    # Validate data
-    validate_restructured_data(restructured_data)
-    
-    # Save to file
-    save_restructured_data(restructured_data, args.output)
-    
+
+    preprocess(args.input_file, args.output)
+
     print("\n🎉 Text Bible preprocessing complete!")
     print(f"📁 Output file: {args.output}")
     print("🚀 Ready for AI translation!")
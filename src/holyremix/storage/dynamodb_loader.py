@@ -6,13 +6,90 @@ Loads processed Bible JSON data into DynamoDB with the proper schema
 for storing translations and baseline KJV text.
 """
 
+import itertools
 import json
+import time
 import boto3
+from boto3.dynamodb.types import TypeSerializer
+
+# orjson parses straight from bytes with SIMD UTF-8 validation; stdlib
+# json is the fallback when it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
 import sys
-from typing import Dict, Any
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Dict, Iterable, Iterator, List
 from botocore.exceptions import ClientError, NoCredentialsError
 import argparse
 
+# Items handed to each worker thread per task — large enough to amortize
+# thread dispatch, small enough to keep progress output flowing
+_CHUNK_SIZE = 500
+
+# BatchWriteItem hard limit on items per request
+_MAX_BATCH = 25
+
+
+def _chunked(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield successive lists of up to `size` items from an iterable."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def iter_bible_items(input_file: str, persona: str = "kjv") -> Iterator[Dict[str, Any]]:
+    """
+    Yield DynamoDB items lazily from a processed Bible JSON file.
+
+    Uses ijson to stream one book at a time instead of materializing the
+    whole Bible dict, so ingestion starts immediately and peak memory is
+    bounded by the largest book. Falls back to a full json.load when ijson
+    is unavailable.
+
+    Args:
+        input_file: Path to the processed Bible JSON file
+        persona: Persona identifier (e.g., "kjv" for baseline)
+
+    Yields:
+        DynamoDB items with pk/sk keys
+    """
+    pk = f"persona#{persona}"
+
+    def items_from(book: str, chapters: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        print(f"📚 Streaming {book}...")
+        for chapter, verses in chapters.items():
+            # Constant per chapter — each verse only adds its own number
+            meta_base = {
+                'book': book,
+                'chapter': int(chapter),
+                'persona': persona,
+                'translation_date': '2024-01-01T00:00:00Z',
+                'model_used': 'baseline'
+            }
+            for verse_num, verse_text in verses.items():
+                yield {
+                    'pk': pk,
+                    'sk': f"book#{book}#{chapter}#{verse_num}",
+                    'translated_text': verse_text,
+                    'metadata': {**meta_base, 'verse': int(verse_num)}
+                }
+
+    try:
+        import ijson
+
+        with open(input_file, 'rb') as f:
+            for book, chapters in ijson.kvitems(f, ''):
+                yield from items_from(book, chapters)
+    except ImportError:
+        with open(input_file, 'rb') as f:
+            bible_data = _loads(f.read())
+        for book, chapters in bible_data.items():
+            yield from items_from(book, chapters)
+
 
 class DynamoDBLoader:
     """Handles loading Bible data to DynamoDB."""
@@ -28,6 +105,10 @@ class DynamoDBLoader:
         self.table_name = table_name
         self.dynamodb = boto3.resource('dynamodb', region_name=region)
         self.table = self.dynamodb.Table(table_name)
+        # Low-level client for the bulk-write path — skips the resource
+        # layer's per-item marshalling in favor of one explicit serialize
+        self.client = boto3.client('dynamodb', region_name=region)
+        self._serializer = TypeSerializer()
     
     def create_table_if_not_exists(self) -> None:
         """Create the DynamoDB table if it doesn't exist."""
@@ -78,68 +159,197 @@ class DynamoDBLoader:
             print(f"❌ Error creating table: {e}")
             sys.exit(1)
     
-    def load_bible_data(self, bible_data: Dict[str, Any], persona: str = "kjv") -> None:
+    def batch_write_items(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Write items with BatchWriteItem instead of one PutItem per verse.
+
+        boto3's batch_writer handles the 25-item-per-request hard limit and
+        retries UnprocessedItems with backoff, so callers can hand over
+        arbitrarily large item lists.
+
+        Args:
+            items: List of DynamoDB items with pk/sk keys
+        """
+        if not items:
+            return
+
+        with self.table.batch_writer(overwrite_by_pkeys=['pk', 'sk']) as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
+    def _write_chunk(self, chunk: List[Dict[str, Any]]) -> int:
+        """
+        Drain one chunk of items through low-level batch_write_item calls.
+
+        Items are serialized to AttributeValue form once up front, then
+        sent 25 per request; UnprocessedItems are retried with exponential
+        backoff. The low-level client skips the resource layer's per-call
+        marshalling and is safe to share across worker threads.
+
+        Args:
+            chunk: DynamoDB items with pk/sk keys
+
+        Returns:
+            Number of items written
+        """
+        serialize = self._serializer.serialize
+        requests = [
+            {'PutRequest': {'Item': {key: serialize(value) for key, value in item.items()}}}
+            for item in chunk
+        ]
+
+        for start in range(0, len(requests), _MAX_BATCH):
+            pending = requests[start:start + _MAX_BATCH]
+            delay = 0.5
+            while pending:
+                response = self.client.batch_write_item(
+                    RequestItems={self.table_name: pending}
+                )
+                pending = response.get('UnprocessedItems', {}).get(self.table_name, [])
+                if pending:
+                    time.sleep(delay)
+                    delay = min(delay * 2, 8.0)
+
+        return len(chunk)
+
+    def load_bible_items(self, items: Iterable[Dict[str, Any]], max_workers: int = 16) -> None:
+        """
+        Write a lazy stream of DynamoDB items in parallel.
+
+        Chunks are pulled from the iterator only as worker slots free up,
+        so a streaming source (see iter_bible_items) overlaps parsing with
+        network writes and never holds the whole Bible in memory.
+
+        Args:
+            items: Iterable of DynamoDB items with pk/sk keys
+            max_workers: Writer threads to fan out across
+        """
+        successful_items = 0
+        failed_items = 0
+
+        def collect(done):
+            nonlocal successful_items, failed_items
+            for future in done:
+                try:
+                    successful_items += future.result()
+                    print(f"   ✅ Loaded {successful_items} verses")
+                except Exception as e:
+                    failed_items += in_flight[future]
+                    print(f"❌ Error loading chunk: {e}")
+                del in_flight[future]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            in_flight = {}
+            for chunk in _chunked(items, _CHUNK_SIZE):
+                # Bound the in-flight window so the iterator is consumed
+                # only as fast as workers drain it
+                if len(in_flight) >= max_workers * 2:
+                    done, _pending = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                in_flight[pool.submit(self._write_chunk, chunk)] = len(chunk)
+
+            collect(as_completed(dict(in_flight)))
+
+        print(f"\n🎉 Loading complete!")
+        print(f"✅ Successful: {successful_items}")
+        print(f"❌ Failed: {failed_items}")
+
+    def load_bible_data(self, bible_data: Dict[str, Any], persona: str = "kjv", max_workers: int = 16) -> None:
         """
         Load Bible data into DynamoDB.
-        
+
+        Items are flattened once, then written in parallel — each worker
+        drains a chunk through its own batch_writer, hiding the per-request
+        latency that serializes a single-threaded load.
+
         Args:
             bible_data: Processed Bible data in format {book: {chapter: {verse: text}}}
             persona: Persona identifier (e.g., "kjv" for baseline)
+            max_workers: Writer threads to fan out across
         """
         print(f"📤 Loading Bible data for persona: {persona}")
-        
-        total_items = 0
+
         successful_items = 0
         failed_items = 0
-        
-        # Count total items first
-        for book, chapters in bible_data.items():
-            for chapter, verses in chapters.items():
-                total_items += len(verses)
-        
-        print(f"📊 Total verses to load: {total_items}")
-        
-        # Load data
+
+        # Flatten the nested dict into DynamoDB items once. Progress is
+        # book-level only — per-chapter prints cost ~1,200 stdout flushes
+        # on a full Bible and serialize the writer threads on the tty lock
+        items = []
+        pk = f"persona#{persona}"
         for book, chapters in bible_data.items():
             print(f"📚 Loading {book}...")
-            
+
             for chapter, verses in chapters.items():
-                print(f"   📖 Chapter {chapter} ({len(verses)} verses)")
-                
+                # Constant per chapter — the inner loop only fills in the
+                # verse-specific fields
+                meta_base = {
+                    'book': book,
+                    'chapter': int(chapter),
+                    'persona': persona,
+                    'translation_date': '2024-01-01T00:00:00Z',
+                    'model_used': 'baseline'
+                }
                 for verse_num, verse_text in verses.items():
-                    try:
-                        # Create item for DynamoDB
-                        item = {
-                            'pk': f"persona#{persona}",
-                            'sk': f"book#{book}#{chapter}#{verse_num}",
-                            'translated_text': verse_text,
-                            'metadata': {
-                                'book': book,
-                                'chapter': int(chapter),
-                                'verse': int(verse_num),
-                                'persona': persona,
-                                'translation_date': '2024-01-01T00:00:00Z',
-                                'model_used': 'baseline'
-                            }
-                        }
-                        
-                        # Put item in DynamoDB
-                        self.table.put_item(Item=item)
-                        successful_items += 1
-                        
-                        # Progress indicator
-                        if successful_items % 100 == 0:
-                            print(f"   ✅ Loaded {successful_items}/{total_items} verses")
-                    
-                    except Exception as e:
-                        print(f"❌ Error loading {book} {chapter}:{verse_num}: {e}")
-                        failed_items += 1
+                    items.append({
+                        'pk': pk,
+                        'sk': f"book#{book}#{chapter}#{verse_num}",
+                        'translated_text': verse_text,
+                        'metadata': {**meta_base, 'verse': int(verse_num)}
+                    })
+
+        total_items = len(items)
+        print(f"📊 Total verses to load: {total_items}")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self._write_chunk, chunk): len(chunk)
+                for chunk in _chunked(items, _CHUNK_SIZE)
+            }
+
+            for future in as_completed(futures):
+                try:
+                    successful_items += future.result()
+                    print(f"   ✅ Loaded {successful_items}/{total_items} verses")
+                except Exception as e:
+                    failed_items += futures[future]
+                    print(f"❌ Error loading chunk: {e}")
         
         print(f"\n🎉 Loading complete!")
         print(f"✅ Successful: {successful_items}")
         print(f"❌ Failed: {failed_items}")
         print(f"📊 Total: {total_items}")
     
+    def existing_sks(self, persona: str = "kjv") -> set:
+        """
+        Collect the sort keys already stored for a persona.
+
+        One paginated query projecting only sk — cheap relative to
+        rewriting ~31k verses — so incremental re-runs can skip items
+        that are already loaded.
+
+        Args:
+            persona: Persona identifier to query
+
+        Returns:
+            Set of sk strings present in the table
+        """
+        sks = set()
+        kwargs = {
+            'KeyConditionExpression': 'pk = :pk',
+            'ExpressionAttributeValues': {':pk': f"persona#{persona}"},
+            'ProjectionExpression': 'sk'
+        }
+
+        while True:
+            response = self.table.query(**kwargs)
+            sks.update(item['sk'] for item in response.get('Items', []))
+
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                return sks
+            kwargs['ExclusiveStartKey'] = last_key
+
     def verify_data(self, persona: str = "kjv") -> None:
         """
         Verify that data was loaded correctly.
@@ -195,24 +405,20 @@ def main():
     parser.add_argument("--persona", default="kjv", help="Persona identifier")
     parser.add_argument("--region", default="us-east-1", help="AWS region")
     parser.add_argument("--verify", action="store_true", help="Verify data after loading")
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="Skip verses already present for this persona (incremental re-run)")
     
     args = parser.parse_args()
     
     print("🎭 HOLY REMIX - DynamoDB Loader")
     print("=" * 40)
     
-    # Load Bible data
-    try:
-        with open(args.input_file, 'r') as f:
-            bible_data = json.load(f)
-    except FileNotFoundError:
+    import os
+    if not os.path.exists(args.input_file):
         print(f"❌ File not found: {args.input_file}")
         print("💡 Run the preprocessor first to generate the JSON file")
         sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error loading file: {e}")
-        sys.exit(1)
-    
+
     # Initialize loader
     try:
         loader = DynamoDBLoader(args.table, args.region)
@@ -220,12 +426,20 @@ def main():
         print("❌ AWS credentials not found")
         print("💡 Run 'aws configure' to set up your credentials")
         sys.exit(1)
-    
+
     # Create table if needed
     loader.create_table_if_not_exists()
-    
-    # Load data
-    loader.load_bible_data(bible_data, args.persona)
+
+    # Stream verses straight from disk into the batch writers — no full
+    # Bible dict in memory, writes start as soon as the first book parses
+    items = iter_bible_items(args.input_file, args.persona)
+
+    if args.skip_existing:
+        existing = loader.existing_sks(args.persona)
+        print(f"⏭️  Found {len(existing)} verses already loaded for {args.persona}")
+        items = (item for item in items if item['sk'] not in existing)
+
+    loader.load_bible_items(items)
     
     # Verify if requested
     if args.verify:
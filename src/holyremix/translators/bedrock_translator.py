@@ -6,33 +6,179 @@ Translates Bible chapters into different personas using Amazon Bedrock.
 Supports retry logic, error handling, and checkpointing for reliability.
 """
 
+import asyncio
+import hashlib
 import json
+import os
 import time
 import re
 import sys
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 import logging
 
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+# orjson serializes to utf-8 bytes several times faster than stdlib json;
+# fall back transparently when it isn't installed
+try:
+    import orjson
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# Add src to path for imports
+sys.path.insert(0, 'src/holyremix')
+
+from utils.translation_cache import TranslationCache
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Compiled once — _parse_translation_response matches this per line across
+# ~31k verses, so skip re's per-call cache lookup
+_VERSE_RE = re.compile(r'^(\d+)\.\s*(.+)$')
+# Multiline variant: one C-level sweep over the whole response instead of a
+# Python-level strip/match per line; tolerates leading/trailing blanks and \r
+_VERSE_RE_MULTI = re.compile(r'(?m)^[ \t]*(\d+)\.[ \t]*(\S.*?)[ \t\r]*$')
+
+
+def _verses_text(verses_dict: Dict[str, str]) -> str:
+    """
+    Render a chapter's verses as "N. text" lines for prompts and token counts.
+
+    Preprocessor output arrives in canonical verse order, so a cheap
+    monotonicity check replaces the N log N sort the prompt builders used
+    to run per chapter; out-of-order dicts still get sorted once.
+    """
+    nums = [int(n) for n in verses_dict]
+    if all(a < b for a, b in zip(nums, nums[1:])):
+        items = verses_dict.items()
+    else:
+        items = sorted(verses_dict.items(), key=lambda x: int(x[0]))
+    return "\n".join(f"{verse_num}. {verse_text}" for verse_num, verse_text in items)
+
+class _StreamVerseMonitor:
+    """
+    Watches a streaming completion for numbered-verse lines.
+
+    Lets invoke abort a clearly malformed generation after a few hundred
+    characters instead of paying for the whole completion and only then
+    failing to parse — on a 176-verse chapter that's most of the tokens.
+    """
+
+    # Give the model this much leeway before the first verse line, and
+    # between verse lines, before declaring the stream malformed
+    MAX_CHARS_WITHOUT_VERSE = 1500
+
+    def __init__(self):
+        self._pending = ""
+        self._chars_since_match = 0
+        self.verses_matched = 0
+
+    def feed(self, text: str) -> bool:
+        """Consume a chunk; returns True when the stream should be aborted."""
+        self._pending += text
+        self._chars_since_match += len(text)
+
+        while "\n" in self._pending:
+            line, self._pending = self._pending.split("\n", 1)
+            if _VERSE_RE.match(line.strip()):
+                self.verses_matched += 1
+                self._chars_since_match = len(self._pending)
+
+        return self._chars_since_match > self.MAX_CHARS_WITHOUT_VERSE
+
+
+# Shared client config: botocore's adaptive retry mode handles throttling
+# with jittered backoff and a token bucket; long read timeout for slow
+# generations, keepalive so pooled connections survive between calls
+_CLIENT_CONFIG = Config(
+    retries={"max_attempts": 8, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=120,
+    tcp_keepalive=True,
+    # Default urllib3 pool is 10 connections; concurrent runs (semaphore
+    # default 16) would serialize on connection acquisition past that.
+    # Sized to the semaphore ceiling plus headroom.
+    max_pool_connections=64,
+)
+
 
 class BedrockTranslator:
-    """Handles AI-powered Bible translations using Amazon Bedrock."""
-    
-    def __init__(self, model_id: str = "us.deepseek.r1-v1:0"):
+    """
+    Handles AI-powered Bible translations using Amazon Bedrock.
+
+    Instantiate once per process and share it: the underlying client keeps
+    a pool of warm TLS connections, and per-chapter instances would pay the
+    TCP + TLS handshake on every request.
+    """
+
+    def __init__(self, model_id: str = "us.deepseek.r1-v1:0", use_cache: bool = True):
         """
         Initialize the Bedrock translator.
-        
+
         Args:
             model_id: Bedrock model ID to use for translations
+            use_cache: If True, reuse cached translations for unchanged
+                (model, persona, verses) inputs instead of re-invoking
         """
         self.model_id = model_id
-        self.bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-        
+        self.cache = TranslationCache() if use_cache else None
+        # Adaptive retry mode rate-limits retries with a client-side token
+        # bucket, replacing hand-rolled ThrottlingException backoff
+        self.bedrock = boto3.client('bedrock-runtime', region_name='us-east-1', config=_CLIENT_CONFIG)
+        # Session (not client) so each async call gets a fresh client with
+        # refreshed credentials; falls back to thread-wrapped sync calls
+        self._asession = aioboto3.Session() if aioboto3 is not None else None
+
+        # Token counting
+        try:
+            import tiktoken
+            self.encoder = tiktoken.get_encoding("cl100k_base")
+            self.tokenizer_available = True
+        except ImportError:
+            logger.warning("tiktoken not available, using rough estimation")
+            self.encoder = None
+            self.tokenizer_available = False
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens in text."""
+        if self.tokenizer_available:
+            return len(self.encoder.encode(text))
+        else:
+            # Rough estimation: ~4 characters per token
+            return len(text) // 4
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts in one parallel encode_batch call.
+
+        Args:
+            texts: List of texts to tokenize
+
+        Returns:
+            List of token counts, one per input text
+        """
+        texts = list(texts)
+        if self.tokenizer_available:
+            return [len(tokens) for tokens in self.encoder.encode_batch(texts, num_threads=8)]
+        else:
+            # Rough estimation: ~4 characters per token
+            return [len(text) // 4 for text in texts]
+
     def create_prompt(self, book: str, chapter: str, verses_dict: Dict[str, str], persona: str) -> str:
         """
         Create the translation prompt for a given persona.
@@ -47,11 +193,8 @@ class BedrockTranslator:
             Formatted prompt string
         """
         # Build verses text
-        verses_text = "\n".join([
-            f"{verse_num}. {verse_text}"
-            for verse_num, verse_text in sorted(verses_dict.items(), key=lambda x: int(x[0]))
-        ])
-        
+        verses_text = _verses_text(verses_dict)
+
         prompt = f"""You are {persona}. Rewrite the following chapter of the Bible in your voice. Keep the number of verses the same. Format each verse like this:
 
 1. [your rewrite]
@@ -80,51 +223,213 @@ Chapter: {book} {chapter}
         Returns:
             Dictionary of verse numbers to translated text, or None if failed
         """
+        # Reruns with identical model, persona, and source verses skip the
+        # Bedrock call entirely
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(f"{self.model_id}\x00{persona}", book, chapter, verses_dict)
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info("⚡ Cache hit for %s %s as %s", book, chapter, persona)
+                return cached
+
         prompt = self.create_prompt(book, chapter, verses_dict, persona)
-        
+
         for attempt in range(max_retries):
             try:
-                logger.info(f"🔄 Translating {book} {chapter} as {persona} (attempt {attempt + 1}/{max_retries})")
-                
-                response = self.bedrock.invoke_model(
-                    modelId=self.model_id,
-                    body=json.dumps({
-                        "prompt": prompt,
-                        "max_tokens": 4000,
-                        "temperature": 0.7,
-                        "top_p": 0.9
-                    })
-                )
-                
-                response_body = json.loads(response['body'].read())
-                translated_text = response_body.get('completion', '').strip()
-                
+                logger.info("🔄 Translating %s %s as %s (attempt %d/%d)",
+                            book, chapter, persona, attempt + 1, max_retries)
+
+                translated_text = self.invoke(prompt, monitor_verses=True)
+
                 # Parse the response into verse dictionary
                 translated_verses = self._parse_translation_response(translated_text, verses_dict)
-                
+
                 if translated_verses:
-                    logger.info(f"✅ Successfully translated {book} {chapter} as {persona}")
+                    logger.info("✅ Successfully translated %s %s as %s", book, chapter, persona)
+                    if self.cache:
+                        self.cache.set(cache_key, translated_verses)
                     return translated_verses
                 else:
-                    logger.warning(f"⚠️  Failed to parse translation response for {book} {chapter}")
+                    logger.warning("⚠️  Failed to parse translation response for %s %s", book, chapter)
                     
             except ClientError as e:
-                error_code = e.response['Error']['Code']
-                if error_code == 'ThrottlingException':
-                    wait_time = (2 ** attempt) * 5  # Exponential backoff
-                    logger.warning(f"⏳ Rate limited, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    logger.error(f"❌ Bedrock error: {e}")
-                    break
-                    
+                # Throttling is already retried inside botocore (adaptive
+                # mode); an error surfacing here is terminal
+                logger.error(f"❌ Bedrock error: {e}")
+                break
+
             except Exception as e:
                 logger.error(f"❌ Unexpected error: {e}")
                 break
         
-        logger.error(f"❌ Failed to translate {book} {chapter} as {persona} after {max_retries} attempts")
+        logger.error("❌ Failed to translate %s %s as %s after %d attempts",
+                     book, chapter, persona, max_retries)
         return None
-    
+
+    async def atranslate_chapter(self, book: str, chapter: str, verses_dict: Dict[str, str],
+                                 persona: str, max_retries: int = 3) -> Optional[Dict[str, str]]:
+        """
+        Async variant of translate_chapter.
+
+        Throttling retries happen inside the client (adaptive mode), so a
+        rate-limited chapter never blocks a worker thread; the loop here
+        only re-prompts on unparseable responses.
+
+        Args:
+            book: Bible book name
+            chapter: Chapter number
+            verses_dict: Dictionary of verse numbers to verse text
+            persona: Persona name for translation
+            max_retries: Maximum number of retry attempts
+
+        Returns:
+            Dictionary of verse numbers to translated text, or None if failed
+        """
+        # Same response cache as the sync path
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(f"{self.model_id}\x00{persona}", book, chapter, verses_dict)
+            cached = self.cache.get(cache_key)
+            if cached:
+                logger.info("⚡ Cache hit for %s %s as %s", book, chapter, persona)
+                return cached
+
+        prompt = self.create_prompt(book, chapter, verses_dict, persona)
+
+        for attempt in range(max_retries):
+            try:
+                logger.info("🔄 Translating %s %s as %s (attempt %d/%d)",
+                            book, chapter, persona, attempt + 1, max_retries)
+
+                translated_text = await self.ainvoke(prompt, monitor_verses=True)
+
+                translated_verses = self._parse_translation_response(translated_text, verses_dict)
+
+                if translated_verses:
+                    logger.info("✅ Successfully translated %s %s as %s", book, chapter, persona)
+                    if self.cache:
+                        self.cache.set(cache_key, translated_verses)
+                    return translated_verses
+                else:
+                    logger.warning("⚠️  Failed to parse translation response for %s %s", book, chapter)
+
+            except ClientError as e:
+                # Throttling is already retried inside botocore (adaptive
+                # mode); an error surfacing here is terminal
+                logger.error(f"❌ Bedrock error: {e}")
+                break
+
+            except Exception as e:
+                logger.error(f"❌ Unexpected error: {e}")
+                break
+
+        logger.error("❌ Failed to translate %s %s as %s after %d attempts",
+                     book, chapter, persona, max_retries)
+        return None
+
+    def invoke(self, prompt: str, max_tokens: int = 4000, monitor_verses: bool = False) -> str:
+        """
+        Invoke the Bedrock model with a prompt and return the raw completion.
+
+        Uses converse_stream so output tokens are consumed as the model
+        generates them instead of blocking until the full response body is
+        assembled server-side; concurrent callers (see atranslate_bible)
+        overlap their requests with streams still draining.
+
+        Args:
+            prompt: Formatted prompt string
+            max_tokens: Maximum tokens for the completion
+            monitor_verses: If True, abandon the stream early when it stops
+                producing numbered-verse lines (malformed generation)
+
+        Returns:
+            Raw completion text from the model
+        """
+        response = self.bedrock.converse_stream(
+            modelId=self.model_id,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [{"text": prompt}]
+                }
+            ],
+            inferenceConfig={
+                "temperature": 0.7,
+                "topP": 0.9,
+                "maxTokens": max_tokens
+            }
+        )
+
+        monitor = _StreamVerseMonitor() if monitor_verses else None
+        chunks = []
+        for event in response["stream"]:
+            delta = event.get("contentBlockDelta", {}).get("delta", {})
+            if "text" in delta:
+                chunks.append(delta["text"])
+                if monitor and monitor.feed(delta["text"]):
+                    # Abandoning the iterator closes the HTTP stream; the
+                    # caller's parse fails fast and retries
+                    logger.warning("⚠️  Aborting malformed stream after %d parsed verses",
+                                   monitor.verses_matched)
+                    break
+
+        return "".join(chunks).strip()
+
+    async def ainvoke(self, prompt: str, max_tokens: int = 4000, monitor_verses: bool = False) -> str:
+        """
+        Invoke the model asynchronously.
+
+        With aioboto3 installed this is a native async call — the stream is
+        awaited on the event loop rather than parking a worker thread per
+        in-flight request. Without it, falls back to running the sync
+        invoke in a thread.
+
+        Args:
+            prompt: Formatted prompt string
+            max_tokens: Maximum tokens for the completion
+            monitor_verses: If True, abandon the stream early when it stops
+                producing numbered-verse lines (malformed generation)
+
+        Returns:
+            Raw completion text from the model
+        """
+        if self._asession is None:
+            # run_in_executor, not asyncio.to_thread (3.9+) — the project
+            # supports Python 3.8
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.invoke, prompt, max_tokens, monitor_verses)
+
+        async with self._asession.client('bedrock-runtime', region_name='us-east-1',
+                                         config=_CLIENT_CONFIG) as bedrock:
+            response = await bedrock.converse_stream(
+                modelId=self.model_id,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [{"text": prompt}]
+                    }
+                ],
+                inferenceConfig={
+                    "temperature": 0.7,
+                    "topP": 0.9,
+                    "maxTokens": max_tokens
+                }
+            )
+
+            monitor = _StreamVerseMonitor() if monitor_verses else None
+            chunks = []
+            async for event in response["stream"]:
+                delta = event.get("contentBlockDelta", {}).get("delta", {})
+                if "text" in delta:
+                    chunks.append(delta["text"])
+                    if monitor and monitor.feed(delta["text"]):
+                        logger.warning("⚠️  Aborting malformed stream after %d parsed verses",
+                                       monitor.verses_matched)
+                        break
+
+        return "".join(chunks).strip()
+
     def _parse_translation_response(self, response_text: str, original_verses: Dict[str, str]) -> Optional[Dict[str, str]]:
         """
         Parse the AI response into a verse dictionary.
@@ -136,145 +441,760 @@ Chapter: {book} {chapter}
         Returns:
             Parsed verse dictionary or None if parsing failed
         """
-        try:
-            # Extract numbered verses using regex
-            verse_pattern = r'^(\d+)\.\s*(.+)$'
-            verses = {}
-            
-            for line in response_text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                    
-                match = re.match(verse_pattern, line)
-                if match:
-                    verse_num = match.group(1)
-                    verse_text = match.group(2).strip()
-                    
-                    # Validate that this verse number exists in original
-                    if verse_num in original_verses:
-                        verses[verse_num] = verse_text
-            
-            # Check if we got all verses
-            if len(verses) == len(original_verses):
-                return verses
-            else:
-                logger.warning(f"⚠️  Parsed {len(verses)} verses, expected {len(original_verses)}")
-                return None
-                
-        except Exception as e:
-            logger.error(f"❌ Error parsing translation response: {e}")
-            return None
+        # One multiline finditer sweep; verse numbers are validated against
+        # the original chapter so stray numbered lines are ignored
+        verses = {
+            match.group(1): match.group(2)
+            for match in _VERSE_RE_MULTI.finditer(response_text)
+            if match.group(1) in original_verses
+        }
+
+        # Check if we got all verses
+        if len(verses) == len(original_verses):
+            return verses
+
+        logger.warning("⚠️  Parsed %d verses, expected %d", len(verses), len(original_verses))
+        return None
 
 
 class TranslationManager:
     """Manages the overall translation process with checkpointing."""
-    
-    def __init__(self, translator: BedrockTranslator):
+
+    # Cap batched input tokens so the concatenated prompt stays well inside
+    # the model's effective context window
+    BATCH_TOKEN_BUDGET = 6000
+    MAX_BATCH_SIZE = 16
+    # Completion budget per chapter in a batch; the single-chapter default
+    # (4000) stays the floor so small batches aren't truncated
+    MAX_TOKENS_PER_CHAPTER = 1500
+    # Consecutive failures before the circuit breaker trips — a persistent
+    # error (exhausted quota, retired model) shouldn't burn through every
+    # remaining chapter
+    CIRCUIT_BREAKER_THRESHOLD = 5
+
+    def __init__(self, translator: BedrockTranslator, batch_size: int = 1, on_chapter=None,
+                 token_table: Optional[Dict[tuple, int]] = None,
+                 fallback_model_id: Optional[str] = None):
         """
         Initialize the translation manager.
-        
+
         Args:
             translator: BedrockTranslator instance
+            batch_size: Number of chapters to pack into one model invocation
+                (1 disables batching)
+            on_chapter: Optional callback (book, chapter, translated_verses)
+                invoked as each chapter completes, e.g. for incremental output
+            token_table: Optional precomputed {(book, chapter): input_tokens}
+                table so batch packing doesn't re-tokenize each chapter
+            fallback_model_id: Optional model to switch to (once) when the
+                circuit breaker trips; without one the run aborts instead
         """
         self.translator = translator
+        self.batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        self.on_chapter = on_chapter
+        self.token_table = token_table or {}
+        self.fallback_model_id = fallback_model_id
         self.checkpoint_file = None
+        self._consecutive_failures = 0
+        self._fallback_used = False
+        self._circuit_open = False
+
+    def _record_failure_for_breaker(self) -> None:
+        """Count a failed chapter; trip the breaker or switch models at the threshold."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures < self.CIRCUIT_BREAKER_THRESHOLD:
+            return
+
+        if self.fallback_model_id and not self._fallback_used:
+            logger.warning(f"⚠️  {self._consecutive_failures} consecutive failures — "
+                           f"switching to fallback model {self.fallback_model_id}")
+            self.translator.model_id = self.fallback_model_id
+            self._fallback_used = True
+            self._consecutive_failures = 0
+        else:
+            self._circuit_open = True
         
     def load_checkpoint(self, persona: str) -> Dict[str, Any]:
         """
         Load translation checkpoint for a persona.
-        
+
+        Replays the append-only checkpoint log (one ``chapter_key\\tstatus``
+        line per outcome, last status wins) plus any legacy
+        ``checkpoint_{persona}.json`` snapshot left by older runs.
+
         Args:
             persona: Persona name
-            
+
         Returns:
             Checkpoint data
         """
-        self.checkpoint_file = f"checkpoint_{persona}.json"
-        
+        self.checkpoint_file = f"checkpoint_{persona}.log"
+        completed = set()
+        failed = set()
+
+        # Seed from the legacy JSON snapshot so pre-log runs resume cleanly
+        try:
+            with open(f"checkpoint_{persona}.json", 'r') as f:
+                legacy = json.load(f)
+            completed.update(legacy.get("completed_chapters", []))
+            failed.update(legacy.get("failed_chapters", []))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Error loading checkpoint: {e}")
+
         try:
             with open(self.checkpoint_file, 'r') as f:
-                return json.load(f)
+                for line in f:
+                    chapter_key, _, status = line.rstrip("\n").partition("\t")
+                    if not chapter_key:
+                        continue
+                    if status == "completed":
+                        completed.add(chapter_key)
+                        failed.discard(chapter_key)
+                    else:
+                        failed.add(chapter_key)
+                        completed.discard(chapter_key)
         except FileNotFoundError:
-            return {"completed_chapters": [], "failed_chapters": []}
+            pass
         except Exception as e:
             logger.error(f"❌ Error loading checkpoint: {e}")
-            return {"completed_chapters": [], "failed_chapters": []}
-    
-    def save_checkpoint(self, persona: str, checkpoint_data: Dict[str, Any]) -> None:
+
+        return {"completed_chapters": sorted(completed), "failed_chapters": sorted(failed)}
+
+    def save_checkpoint(self, chapter_key: str, status: str) -> None:
         """
-        Save translation checkpoint for a persona.
-        
+        Append one chapter's outcome to the checkpoint log.
+
+        O(1) per chapter: a single flushed line, instead of re-serializing
+        the whole growing checkpoint dict after every completion.
+
         Args:
-            persona: Persona name
-            checkpoint_data: Checkpoint data to save
+            chapter_key: "{book}_{chapter}" key for the chapter
+            status: "completed" or "failed"
         """
         try:
-            with open(self.checkpoint_file, 'w') as f:
-                json.dump(checkpoint_data, f, indent=2)
+            with open(self.checkpoint_file, 'a') as f:
+                f.write(f"{chapter_key}\t{status}\n")
+                f.flush()
         except Exception as e:
             logger.error(f"❌ Error saving checkpoint: {e}")
     
-    def translate_bible(self, kjv_data: Dict[str, Any], persona: str, dry_run: bool = False) -> Dict[str, Any]:
+    def translate_bible(self, kjv_data: Dict[str, Any], persona: str, dry_run: bool = False,
+                        skip_chapters: Optional[set] = None) -> Dict[str, Any]:
         """
         Translate the entire Bible for a given persona.
-        
+
         Args:
             kjv_data: Restructured KJV data
             persona: Persona name for translation
             dry_run: If True, only show what would be translated
-            
+            skip_chapters: Extra chapter keys to treat as already completed
+                (e.g. chapters recovered from a partial output file)
+
         Returns:
             Translated Bible data
         """
         print(f"🎭 Starting Bible translation for persona: {persona}")
         print("=" * 50)
-        
+
         checkpoint = self.load_checkpoint(persona)
         completed_chapters = set(checkpoint["completed_chapters"])
+        if skip_chapters:
+            completed_chapters |= skip_chapters
         failed_chapters = set(checkpoint["failed_chapters"])
         
-        translated_bible = {}
+        translated_bible = {book: {} for book in kjv_data}
+        pending = self._collect_pending(kjv_data, persona, completed_chapters, failed_chapters)
+        pending, duplicates = self._dedup_pending(pending)
+
+        if dry_run:
+            self._print_plan(self.plan_translations(pending), persona)
+            return translated_bible
+
+        # Translate in batches so the persona instruction is sent once per
+        # batch instead of once per chapter
+        self._consecutive_failures = 0
+        self._circuit_open = False
+        for batch in self._pack_batches(pending):
+            if self._circuit_open:
+                logger.error(f"❌ Circuit breaker open after "
+                             f"{self.CIRCUIT_BREAKER_THRESHOLD} consecutive failures — "
+                             f"aborting run (resume from checkpoint once resolved)")
+                break
+            if len(batch) == 1:
+                book, chapter, verses = batch[0]
+                results = {(book, chapter): self.translator.translate_chapter(book, chapter, verses, persona)}
+            else:
+                results = self._translate_batch(batch, persona)
+
+            self._record_batch_results(batch, results, translated_bible,
+                                       completed_chapters, failed_chapters, persona)
+
+        self._apply_duplicates(duplicates, translated_bible, completed_chapters)
+        return translated_bible
+
+    async def atranslate_bible(self, kjv_data: Dict[str, Any], persona: str, dry_run: bool = False,
+                               semaphore: Optional[asyncio.Semaphore] = None,
+                               skip_chapters: Optional[set] = None) -> Dict[str, Any]:
+        """
+        Async variant of translate_bible with bounded concurrent Bedrock calls.
+
+        Args:
+            kjv_data: Restructured KJV data
+            persona: Persona name for translation
+            dry_run: If True, only show what would be translated
+            semaphore: Optional shared semaphore bounding in-flight requests
+                (may be shared across personas)
+            skip_chapters: Extra chapter keys to treat as already completed
+                (e.g. chapters recovered from a partial output file)
+
+        Returns:
+            Translated Bible data
+        """
+        print(f"🎭 Starting Bible translation for persona: {persona}")
+        print("=" * 50)
+
+        checkpoint = self.load_checkpoint(persona)
+        completed_chapters = set(checkpoint["completed_chapters"])
+        if skip_chapters:
+            completed_chapters |= skip_chapters
+        failed_chapters = set(checkpoint["failed_chapters"])
+
+        translated_bible = {book: {} for book in kjv_data}
+        pending = self._collect_pending(kjv_data, persona, completed_chapters, failed_chapters)
+        pending, duplicates = self._dedup_pending(pending)
+
+        if dry_run:
+            self._print_plan(self.plan_translations(pending), persona)
+            return translated_bible
+
+        if semaphore is None:
+            # Sized to the Bedrock per-model TPS quota; overridable per env
+            semaphore = asyncio.Semaphore(int(os.getenv("BEDROCK_CONCURRENCY", "16")))
+
+        async def run_batch(batch):
+            async with semaphore:
+                if len(batch) == 1:
+                    book, chapter, verses = batch[0]
+                    result = await self.translator.atranslate_chapter(book, chapter, verses, persona)
+                    return batch, {(book, chapter): result}
+                loop = asyncio.get_event_loop()
+                return batch, await loop.run_in_executor(None, self._translate_batch, batch, persona)
+
+        self._consecutive_failures = 0
+        self._circuit_open = False
+        tasks = [asyncio.create_task(run_batch(batch)) for batch in self._pack_batches(pending)]
+
+        # Record results as they complete so the checkpoint stays current;
+        # already-finished batches are still recorded after the breaker trips
+        cancelled = False
+        for future in asyncio.as_completed(tasks):
+            try:
+                batch, results = await future
+            except asyncio.CancelledError:
+                continue
+            self._record_batch_results(batch, results, translated_bible,
+                                       completed_chapters, failed_chapters, persona)
+            if self._circuit_open and not cancelled:
+                logger.error(f"❌ Circuit breaker open after "
+                             f"{self.CIRCUIT_BREAKER_THRESHOLD} consecutive failures — "
+                             f"cancelling remaining work (resume from checkpoint once resolved)")
+                for task in tasks:
+                    task.cancel()
+                cancelled = True
+
+        self._apply_duplicates(duplicates, translated_bible, completed_chapters)
+        return translated_bible
+
+    def translate_personas(self, kjv_data: Dict[str, Any], personas: List[str],
+                           dry_run: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate the same Bible for several personas, sharing input-side work.
+
+        Personas run one after another over identical input, so the
+        persona-independent work — per-chapter token counts in token_table,
+        batch packing decisions derived from them — is computed on the first
+        pass and reused for every subsequent persona. Chapters stay in
+        canonical book order within each persona to keep context hot.
+
+        Args:
+            kjv_data: Restructured KJV data
+            personas: Persona names, each with its own checkpoint and output
+            dry_run: If True, only show what would be translated
+
+        Returns:
+            Mapping of persona -> translated Bible data
+        """
+        return {persona: self.translate_bible(kjv_data, persona, dry_run)
+                for persona in personas}
+
+    async def atranslate_personas(self, kjv_data: Dict[str, Any], personas: List[str],
+                                  dry_run: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Async variant of translate_personas.
+
+        Personas still run sequentially — concurrency lives inside each
+        persona's chapter fan-out — and share one semaphore so the Bedrock
+        quota isn't oversubscribed across the whole run.
+
+        Args:
+            kjv_data: Restructured KJV data
+            personas: Persona names, each with its own checkpoint and output
+            dry_run: If True, only show what would be translated
+
+        Returns:
+            Mapping of persona -> translated Bible data
+        """
+        semaphore = asyncio.Semaphore(int(os.getenv("BEDROCK_CONCURRENCY", "16")))
+        results = {}
+        for persona in personas:
+            results[persona] = await self.atranslate_bible(
+                kjv_data, persona, dry_run, semaphore=semaphore)
+        return results
+
+    def submit_batch_job(self, kjv_data: Dict[str, Any], persona: str, s3_uri: str,
+                         role_arn: str, poll_interval: int = 60) -> Dict[str, Any]:
+        """
+        Translate the whole Bible as one Bedrock Batch Inference job.
+
+        All chapter prompts are written to S3 as JSONL and submitted via
+        CreateModelInvocationJob; AWS parallelizes server-side at roughly
+        half the per-token price of real-time invocations, in exchange for
+        latency. Intended for full-Bible runs where nobody is watching.
+
+        Args:
+            kjv_data: Restructured KJV data
+            persona: Persona name for translation
+            s3_uri: S3 prefix (s3://bucket/prefix) for job input and output
+            role_arn: IAM role ARN Bedrock assumes to read/write the bucket
+            poll_interval: Seconds between job status polls
+
+        Returns:
+            Translated Bible data (chapters that failed to parse are omitted)
+        """
+        if s3_uri.startswith("s3://"):
+            s3_uri = s3_uri[5:]
+        bucket, _, prefix = s3_uri.partition("/")
+        prefix = prefix.rstrip("/")
+        s3 = boto3.client('s3')
+        bedrock = boto3.client('bedrock', region_name='us-east-1')
+
+        # One record per chapter, keyed so responses map back to chapters
+        pending = [(book, chapter, verses)
+                   for book, chapters in kjv_data.items()
+                   for chapter, verses in chapters.items()]
+        lines = []
+        for book, chapter, verses in pending:
+            record = {
+                "recordId": f"{book}_{chapter}",
+                "modelInput": {
+                    "prompt": self.translator.create_prompt(book, chapter, verses, persona),
+                    "max_tokens": 4000,
+                    "temperature": 0.7,
+                    "top_p": 0.9
+                }
+            }
+            lines.append(_dumps_bytes(record))
+
+        input_key = f"{prefix}/input.jsonl" if prefix else "input.jsonl"
+        output_prefix = f"{prefix}/output/" if prefix else "output/"
+        s3.put_object(Bucket=bucket, Key=input_key, Body=b"\n".join(lines))
+        print(f"📤 Uploaded {len(lines)} chapter prompts to s3://{bucket}/{input_key}")
+
+        job_name = f"holyremix-{persona}-{time.strftime('%Y%m%d-%H%M%S')}"
+        response = bedrock.create_model_invocation_job(
+            jobName=job_name,
+            modelId=self.translator.model_id,
+            roleArn=role_arn,
+            inputDataConfig={"s3InputDataConfig": {"s3Uri": f"s3://{bucket}/{input_key}"}},
+            outputDataConfig={"s3OutputDataConfig": {"s3Uri": f"s3://{bucket}/{output_prefix}"}}
+        )
+        job_arn = response["jobArn"]
+        print(f"🚀 Submitted batch job {job_name}")
+
+        while True:
+            status = bedrock.get_model_invocation_job(jobIdentifier=job_arn)["status"]
+            if status == "Completed":
+                break
+            if status in ("Failed", "Stopped", "Expired"):
+                logger.error(f"❌ Batch job ended with status {status}")
+                return {}
+            print(f"⏳ Batch job status: {status}, polling again in {poll_interval}s")
+            time.sleep(poll_interval)
+
+        return self._collect_batch_output(s3, bucket, output_prefix, kjv_data)
+
+    def _collect_batch_output(self, s3, bucket: str, output_prefix: str,
+                              kjv_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Download a completed batch job's output and parse it per chapter."""
+        translated_bible = {book: {} for book in kjv_data}
+
+        paginator = s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=output_prefix):
+            for obj in page.get('Contents', []):
+                if not obj['Key'].endswith('.jsonl.out'):
+                    continue
+                body = s3.get_object(Bucket=bucket, Key=obj['Key'])['Body'].read()
+                for line in body.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    book, _, chapter = record["recordId"].rpartition("_")
+                    output = record.get("modelOutput", {})
+                    text = output.get("text") or output.get("completion", "")
+                    verses = kjv_data.get(book, {}).get(chapter)
+                    if verses is None:
+                        continue
+                    parsed = self.translator._parse_translation_response(text, verses)
+                    if parsed:
+                        translated_bible[book][chapter] = parsed
+                    else:
+                        logger.warning("⚠️  Batch output unparseable for %s %s", book, chapter)
+
+        return translated_bible
+
+    def _collect_pending(self, kjv_data: Dict[str, Any], persona: str, completed_chapters: set,
+                         failed_chapters: set) -> List[tuple]:
+        """
+        Collect chapters that still need translation.
+
+        Args:
+            kjv_data: Restructured KJV data
+            persona: Persona name for translation
+            completed_chapters: Set of already-completed chapter keys
+            failed_chapters: Set of previously-failed chapter keys
+
+        Returns:
+            List of (book, chapter, verses_dict) tuples
+        """
         total_chapters = sum(len(chapters) for chapters in kjv_data.values())
-        processed_chapters = 0
-        
+        skipped_completed = 0
+        skipped_failed = 0
+        pending = []
+
         for book, chapters in kjv_data.items():
-            translated_bible[book] = {}
-            
             for chapter, verses in chapters.items():
                 chapter_key = f"{book}_{chapter}"
-                processed_chapters += 1
-                
-                print(f"📖 Processing {book} {chapter} ({processed_chapters}/{total_chapters})")
-                
+
                 # Skip if already completed
                 if chapter_key in completed_chapters:
-                    print(f"⏭️  Skipping {book} {chapter} (already completed)")
+                    skipped_completed += 1
                     continue
-                
+
                 # Skip if previously failed
                 if chapter_key in failed_chapters:
-                    print(f"⚠️  Skipping {book} {chapter} (previously failed)")
+                    skipped_failed += 1
                     continue
-                
-                if dry_run:
-                    print(f"🔍 DRY RUN: Would translate {book} {chapter} as {persona}")
-                    continue
-                
-                # Perform translation
-                translated_verses = self.translator.translate_chapter(book, chapter, verses, persona)
-                
-                if translated_verses:
-                    translated_bible[book][chapter] = translated_verses
-                    completed_chapters.add(chapter_key)
-                    checkpoint["completed_chapters"] = list(completed_chapters)
-                    self.save_checkpoint(persona, checkpoint)
-                else:
-                    failed_chapters.add(chapter_key)
-                    checkpoint["failed_chapters"] = list(failed_chapters)
-                    self.save_checkpoint(persona, checkpoint)
-        
-        return translated_bible
+
+                pending.append((book, chapter, verses))
+
+        # One summary line instead of 1,189 per-chapter prints — at high
+        # concurrency the stdout lock becomes a real serialization point
+        print(f"📖 {len(pending)}/{total_chapters} chapters pending "
+              f"({skipped_completed} completed, {skipped_failed} failed previously)")
+
+        return pending
+
+    def _dedup_pending(self, pending: List[tuple]) -> tuple:
+        """
+        Split pending chapters into unique content and exact duplicates.
+
+        Parallel passages (2 Kings 18-20 / Isaiah 36-39, Psalm 14 / 53)
+        repeat verbatim across books; translating them once and copying
+        the result saves the duplicate API calls outright.
+
+        Args:
+            pending: List of (book, chapter, verses_dict) tuples
+
+        Returns:
+            (unique_pending, duplicates) where duplicates maps each copy
+            to its source as (book, chapter, src_book, src_chapter)
+        """
+        seen = {}
+        unique_pending = []
+        duplicates = []
+
+        for book, chapter, verses in pending:
+            content_hash = hashlib.blake2b(
+                json.dumps(verses, sort_keys=True).encode('utf-8'),
+                digest_size=16).hexdigest()
+            source = seen.get(content_hash)
+            if source is None:
+                seen[content_hash] = (book, chapter)
+                unique_pending.append((book, chapter, verses))
+            else:
+                duplicates.append((book, chapter, source[0], source[1]))
+
+        if duplicates:
+            logger.info("⚡ %d chapters are verbatim duplicates — translating once",
+                        len(duplicates))
+        return unique_pending, duplicates
+
+    def _apply_duplicates(self, duplicates: List[tuple], translated_bible: Dict[str, Any],
+                          completed_chapters: set) -> None:
+        """Copy translations onto duplicate chapters whose source succeeded."""
+        for book, chapter, src_book, src_chapter in duplicates:
+            translated_verses = translated_bible.get(src_book, {}).get(src_chapter)
+            if not translated_verses:
+                continue  # source failed; the copy stays pending for next run
+            translated_bible[book][chapter] = dict(translated_verses)
+            completed_chapters.add(f"{book}_{chapter}")
+            # Emit the copied verses before logging "completed", same
+            # ordering as _record_batch_results
+            if self.on_chapter:
+                self.on_chapter(book, chapter, translated_bible[book][chapter])
+            self.save_checkpoint(f"{book}_{chapter}", "completed")
+
+    def plan_translations(self, pending: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Build a per-chapter plan with token estimates and batching strategy.
+
+        Missing token counts are filled in with one batched tokenization
+        pass, so planning a full Bible costs a single encode_batch call.
+
+        Args:
+            pending: List of (book, chapter, verses_dict) tuples
+
+        Returns:
+            List of plan dicts with book, chapter, tokens, and strategy
+        """
+        missing = [(book, chapter, verses) for book, chapter, verses in pending
+                   if (book, chapter) not in self.token_table]
+        if missing:
+            texts = [_verses_text(verses) for _book, _chapter, verses in missing]
+            counts = self.translator.count_tokens_batch(texts)
+            self.token_table.update({
+                (book, chapter): count
+                for (book, chapter, _verses), count in zip(missing, counts)
+            })
+
+        plan = []
+        for book, chapter, verses in pending:
+            tokens = self.token_table[(book, chapter)]
+            if tokens >= self.BATCH_TOKEN_BUDGET:
+                strategy = "solo"
+            elif self.batch_size > 1:
+                strategy = "batched"
+            else:
+                strategy = "single"
+            plan.append({"book": book, "chapter": chapter, "tokens": tokens, "strategy": strategy})
+
+        return plan
+
+    def _print_plan(self, plan: List[Dict[str, Any]], persona: str) -> None:
+        """Render a dry-run plan without issuing any API calls."""
+        print(f"🔍 DRY RUN plan for {persona}: {len(plan)} chapters")
+        for item in plan:
+            print(f"   {item['book']} {item['chapter']}: ~{item['tokens']} input tokens ({item['strategy']})")
+
+        total_tokens = sum(item['tokens'] for item in plan)
+        n_solo = sum(1 for item in plan if item['strategy'] == 'solo')
+        print(f"📊 Plan total: ~{total_tokens} input tokens, {n_solo} oversize chapters translated solo")
+
+    def _record_batch_results(self, batch: List[tuple], results: Dict[tuple, Optional[Dict[str, str]]],
+                              translated_bible: Dict[str, Any],
+                              completed_chapters: set, failed_chapters: set, persona: str) -> None:
+        """Record translated batch results and append outcomes to the checkpoint log."""
+        for book, chapter, verses in batch:
+            chapter_key = f"{book}_{chapter}"
+            translated_verses = results.get((book, chapter))
+
+            if translated_verses:
+                translated_bible[book][chapter] = translated_verses
+                completed_chapters.add(chapter_key)
+                # Persist the chapter output before logging "completed" —
+                # the log must never claim work that isn't on disk yet
+                if self.on_chapter:
+                    self.on_chapter(book, chapter, translated_verses)
+                self.save_checkpoint(chapter_key, "completed")
+                self._consecutive_failures = 0
+            else:
+                failed_chapters.add(chapter_key)
+                self.save_checkpoint(chapter_key, "failed")
+                self._record_failure_for_breaker()
+
+    def _pack_batches(self, pending: List[tuple]) -> List[List[tuple]]:
+        """
+        Group pending chapters into batches bounded by batch_size and token budget.
+
+        Args:
+            pending: List of (book, chapter, verses_dict) tuples
+
+        Returns:
+            List of batches, each a list of (book, chapter, verses_dict) tuples
+        """
+        if self.batch_size <= 1:
+            return [[item] for item in pending]
+
+        batches = []
+        current = []
+        current_tokens = 0
+
+        for book, chapter, verses in pending:
+            chapter_tokens = self.token_table.get((book, chapter))
+            if chapter_tokens is None:
+                chapter_tokens = self.translator.count_tokens(_verses_text(verses))
+                # Remember it — later personas over the same input skip the
+                # tokenize entirely
+                self.token_table[(book, chapter)] = chapter_tokens
+
+            # A chapter that saturates the budget on its own is translated solo
+            if chapter_tokens >= self.BATCH_TOKEN_BUDGET:
+                if current:
+                    batches.append(current)
+                    current = []
+                    current_tokens = 0
+                batches.append([(book, chapter, verses)])
+                continue
+
+            if current and (len(current) >= self.batch_size or
+                            current_tokens + chapter_tokens > self.BATCH_TOKEN_BUDGET):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+
+            current.append((book, chapter, verses))
+            current_tokens += chapter_tokens
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _build_batch_prompt(self, batch: List[tuple], persona: str) -> str:
+        """
+        Build a single prompt covering multiple chapters with a shared persona instruction.
+
+        Args:
+            batch: List of (book, chapter, verses_dict) tuples
+            persona: Persona name for translation
+
+        Returns:
+            Formatted multi-chapter prompt string
+        """
+        sections = []
+        for i, (book, chapter, verses) in enumerate(batch, 1):
+            sections.append(f"===CHAPTER {i}: {book} {chapter}===\n{_verses_text(verses)}")
+
+        chapters_text = "\n\n".join(sections)
+
+        return f"""You are {persona}. Rewrite each of the following Bible chapters in your voice. Keep the number of verses in each chapter the same. For each chapter, start your rewrite with a line ===RESPONSE k=== matching the chapter's number, then format each verse like this:
+
+1. [your rewrite]
+2. ...
+3. ...
+
+Do not skip chapters or verses. Do not add extra commentary. Return only the response blocks with numbered verses.
+
+{chapters_text}"""
+
+    def _translate_batch(self, batch: List[tuple], persona: str) -> Dict[tuple, Optional[Dict[str, str]]]:
+        """
+        Translate a batch of chapters with one model invocation.
+
+        Args:
+            batch: List of (book, chapter, verses_dict) tuples
+            persona: Persona name for translation
+
+        Returns:
+            Dictionary mapping (book, chapter) to translated verses (or None on failure)
+        """
+        prompt = self._build_batch_prompt(batch, persona)
+        results = {}
+
+        try:
+            logger.info("🔄 Translating batch of %d chapters as %s", len(batch), persona)
+            # Scale the completion budget with the batch: a K-chapter batch
+            # needs roughly K chapters' worth of output tokens
+            max_tokens = max(4000, len(batch) * self.MAX_TOKENS_PER_CHAPTER)
+            translated_text = self.translator.invoke(prompt, max_tokens=max_tokens)
+        except ClientError as e:
+            logger.error(f"❌ Bedrock error on batch: {e}")
+            return results
+        except Exception as e:
+            logger.error(f"❌ Unexpected error on batch: {e}")
+            return results
+
+        # Split the concatenated response back into per-chapter blocks
+        blocks = {}
+        for match in re.finditer(r'===RESPONSE (\d+)===\n?(.*?)(?====RESPONSE \d+===|\Z)', translated_text, re.DOTALL):
+            blocks[int(match.group(1))] = match.group(2).strip()
+
+        for i, (book, chapter, verses) in enumerate(batch, 1):
+            block = blocks.get(i)
+            if block:
+                results[(book, chapter)] = self.translator._parse_translation_response(block, verses)
+            else:
+                logger.warning("⚠️  Batch response missing block for %s %s", book, chapter)
+                results[(book, chapter)] = None
+
+        # Fall back to per-chapter calls for anything the batch failed to produce
+        for book, chapter, verses in batch:
+            if not results.get((book, chapter)):
+                results[(book, chapter)] = self.translator.translate_chapter(book, chapter, verses, persona)
+
+        return results
+
+
+def chapter_writer(persona: str, output_dir: str = "out"):
+    """
+    Build an on_chapter callback that persists each chapter as it completes.
+
+    Writes out/{persona}/{book}/{chapter}.json per chapter so a crash loses
+    at most the in-flight chapter, and memory stays bounded regardless of
+    how much of the Bible has been translated.
+
+    Args:
+        persona: Persona name (used as the output subdirectory)
+        output_dir: Root directory for per-chapter output
+
+    Returns:
+        Callback suitable for TranslationManager(on_chapter=...)
+    """
+    def write_chapter(book: str, chapter: str, translated_verses: Dict[str, str]) -> None:
+        chapter_dir = Path(output_dir) / persona / book
+        chapter_dir.mkdir(parents=True, exist_ok=True)
+        (chapter_dir / f"{chapter}.json").write_bytes(_dumps_bytes(translated_verses))
+
+    return write_chapter
+
+
+def merge_chapter_files(persona: str, output_file: str, output_dir: str = "out") -> int:
+    """
+    Merge per-chapter output files into one combined Bible JSON.
+
+    Streams chapter files straight into the combined file with manual comma
+    bookkeeping, so the merge never holds more than one chapter in memory.
+
+    Args:
+        persona: Persona name whose chapter files to merge
+        output_file: Path for the combined JSON file
+        output_dir: Root directory holding per-chapter output
+
+    Returns:
+        Number of chapters merged
+    """
+    persona_dir = Path(output_dir) / persona
+    merged = 0
+
+    with open(output_file, 'w', encoding='utf-8') as out:
+        out.write("{")
+        for b, book_dir in enumerate(sorted(p for p in persona_dir.iterdir() if p.is_dir())):
+            if b:
+                out.write(",")
+            out.write(f"\n{json.dumps(book_dir.name)}: {{")
+            chapter_files = sorted(book_dir.glob("*.json"), key=lambda p: int(p.stem))
+            for c, chapter_file in enumerate(chapter_files):
+                if c:
+                    out.write(",")
+                out.write(f"\n{json.dumps(chapter_file.stem)}: ")
+                out.write(chapter_file.read_text(encoding='utf-8'))
+                merged += 1
+            out.write("\n}")
+        out.write("\n}\n")
+
+    return merged
 
 
 def main():
@@ -299,9 +1219,9 @@ def main():
         print("💡 Run scripts/kjv_preprocessor.py first to download and structure the KJV data")
         sys.exit(1)
     
-    # Initialize translator
+    # Initialize translator; each chapter is persisted as it completes
     translator = BedrockTranslator()
-    manager = TranslationManager(translator)
+    manager = TranslationManager(translator, on_chapter=chapter_writer(args.persona))
     
     if args.book and args.chapter:
         # Translate specific chapter
@@ -318,14 +1238,13 @@ def main():
             print(f"❌ Chapter {args.book} {args.chapter} not found")
     else:
         # Translate entire Bible
-        result = manager.translate_bible(kjv_data, args.persona, args.dry_run)
-        
+        manager.translate_bible(kjv_data, args.persona, args.dry_run)
+
         if not args.dry_run:
-            # Save results
+            # Chapters were written incrementally; merge them into one file
             output_file = f"translated_bible_{args.persona}.json"
-            with open(output_file, 'w') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            print(f"💾 Translation saved to {output_file}")
+            merged = merge_chapter_files(args.persona, output_file)
+            print(f"💾 Merged {merged} chapters into {output_file}")
 
 
 if __name__ == "__main__":
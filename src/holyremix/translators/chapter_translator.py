@@ -4,7 +4,10 @@ Chapter-based Bible translator with strict JSON output for database ingestion.
 """
 
 import boto3
+import functools
+import hashlib
 import json
+import re
 import time
 import logging
 from pathlib import Path
@@ -15,8 +18,9 @@ import sys
 sys.path.insert(0, 'src/holyremix')
 
 from utils.prompt_templates import get_strict_json_prompt
-from utils.schema_validator import BibleTranslationValidator
+from utils.schema_validator import VALIDATOR
 from utils.persona_loader import get_hardcore_prompt
+from utils.translation_cache import TranslationCache
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -25,21 +29,32 @@ logger = logging.getLogger(__name__)
 class ChapterTranslator:
     """Handles chapter-based Bible translation with strict JSON output for database ingestion."""
     
-    def __init__(self, model_id: str = "us.deepseek.r1-v1:0", max_tokens: int = 4000, intensity: str = "medium"):
+    def __init__(self, model_id: str = "us.deepseek.r1-v1:0", max_tokens: int = 4000, intensity: str = "medium",
+                 use_cache: bool = True):
         """
         Initialize the chapter translator.
-        
+
         Args:
             model_id: Bedrock model ID to use
             max_tokens: Maximum safe tokens for the model
             intensity: "mild", "medium", "wild", or "nuclear" for style transfer
+            use_cache: If True, reuse cached translations for unchanged inputs
         """
         self.model_id = model_id
         self.max_tokens = max_tokens
         self.intensity = intensity
         self.bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
-        self.validator = BibleTranslationValidator()
-        
+        self.validator = VALIDATOR
+        self.cache = TranslationCache() if use_cache else None
+
+        # Caches so repeated estimate/check/translate passes over the same
+        # chapter don't redo prompt construction and BPE encoding. The
+        # token cache hangs off the instance (not the method) so instances
+        # stay collectable and don't share entries
+        self._prompt_cache = {}
+        self._persona_prompt_tokens = {}
+        self.count_tokens = functools.lru_cache(maxsize=4096)(self._count_tokens)
+
         # Token counting
         try:
             import tiktoken
@@ -50,14 +65,55 @@ class ChapterTranslator:
             self.encoder = None
             self.tokenizer_available = False
     
-    def count_tokens(self, text: str) -> int:
-        """Count tokens in text."""
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens in text. Memoized per instance via count_tokens."""
         if self.tokenizer_available:
             return len(self.encoder.encode(text))
         else:
             # Rough estimation: ~4 characters per token
             return len(text) // 4
-    
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for many texts in one call.
+
+        Uses tiktoken's encode_batch, which releases the GIL and tokenizes
+        in parallel C threads, instead of a Python loop of encode() calls.
+
+        Args:
+            texts: List of texts to tokenize
+
+        Returns:
+            List of token counts, one per input text
+        """
+        texts = list(texts)
+        if self.tokenizer_available:
+            return [len(tokens) for tokens in self.encoder.encode_batch(texts, num_threads=8)]
+        else:
+            # Rough estimation: ~4 characters per token
+            return [len(text) // 4 for text in texts]
+
+    def persona_prompt_tokens(self, persona: str) -> int:
+        """
+        Token count of the persona context, computed once per persona.
+
+        Args:
+            persona: Persona name for translation
+
+        Returns:
+            Number of tokens in the persona context block
+        """
+        if persona not in self._persona_prompt_tokens:
+            self._persona_prompt_tokens[persona] = self.count_tokens(self._persona_context(persona))
+        return self._persona_prompt_tokens[persona]
+
+    def _persona_context(self, persona: str) -> str:
+        """Build the persona context block that prefixes every prompt."""
+        hardcore_prompts = get_hardcore_prompt(persona, self.intensity)
+        if hardcore_prompts:
+            return f"Context: {hardcore_prompts['system_prompt']}\n\n"
+        return f"Context: You are {persona}.\n\n"
+
     def create_strict_json_prompt(self, book: str, chapter: str, verses_dict: Dict[str, str], persona: str) -> str:
         """
         Create a strict JSON prompt for database-compatible translation.
@@ -71,24 +127,50 @@ class ChapterTranslator:
         Returns:
             Formatted prompt with strict JSON requirements
         """
+        # Key on the verses content too — the same chapter key with
+        # different verses must not return a stale prompt
+        verses_digest = hashlib.blake2b(
+            json.dumps(verses_dict, sort_keys=True).encode("utf-8"), digest_size=16
+        ).digest()
+        cache_key = (book, chapter, persona, verses_digest)
+        if cache_key in self._prompt_cache:
+            return self._prompt_cache[cache_key]
+
         # Get persona-specific context
-        hardcore_prompts = get_hardcore_prompt(persona, self.intensity)
-        
+        persona_context = self._persona_context(persona)
+
         # Format chapter text for context
         chapter_text = self.format_chapter_for_context(book, chapter, verses_dict)
-        
+
         # Get the strict JSON prompt template
         base_prompt = get_strict_json_prompt(book, chapter, persona, max(verses_dict.keys(), key=int))
-        
-        # Add persona context and chapter text
-        if hardcore_prompts:
-            persona_context = f"Context: {hardcore_prompts['system_prompt']}\n\n"
-        else:
-            persona_context = f"Context: You are {persona}.\n\n"
-        
+
         full_prompt = f"{persona_context}{base_prompt}\n\nChapter text:\n{chapter_text}"
-        
+        self._prompt_cache[cache_key] = full_prompt
+
         return full_prompt
+
+    def _prompt_parts(self, book: str, chapter: str, verses_dict: Dict[str, str], persona: str) -> Tuple[str, str]:
+        """
+        Build the prompt split into (persona context, chapter body).
+
+        Keeping the persona context separate lets converse-style calls send
+        it as the system prompt — byte-identical across every chapter of a
+        persona run, so consecutive requests share the same prefix.
+
+        Args:
+            book: Bible book name
+            chapter: Chapter number
+            verses_dict: Dictionary of verse numbers to verse text
+            persona: Persona name for translation
+
+        Returns:
+            Tuple of (persona_context, body_prompt)
+        """
+        persona_context = self._persona_context(persona)
+        chapter_text = self.format_chapter_for_context(book, chapter, verses_dict)
+        base_prompt = get_strict_json_prompt(book, chapter, persona, max(verses_dict.keys(), key=int))
+        return persona_context, f"{base_prompt}\n\nChapter text:\n{chapter_text}"
     
     def format_chapter_for_context(self, book: str, chapter: str, verses_dict: Dict[str, str]) -> str:
         """
@@ -125,9 +207,12 @@ class ChapterTranslator:
         Returns:
             Tuple of (input_tokens, estimated_output_tokens)
         """
-        prompt = self.create_strict_json_prompt(book, chapter, verses_dict, persona)
-        input_tokens = self.count_tokens(prompt)
-        
+        # Sum verse tokens with one GIL-free encode_batch call, then add the
+        # persona context and prompt template overhead (both cached)
+        verse_tokens = sum(self.count_tokens_batch(verses_dict.values()))
+        base_prompt = get_strict_json_prompt(book, chapter, persona, max(verses_dict.keys(), key=int))
+        input_tokens = verse_tokens + self.persona_prompt_tokens(persona) + self.count_tokens(base_prompt)
+
         # Estimate output tokens based on persona verbosity and JSON structure
         persona_ratios = {
             "samuel_l_jackson": 1.3,
@@ -157,20 +242,34 @@ class ChapterTranslator:
         Returns:
             Dictionary of verse numbers to translated text, or None if failed
         """
-        prompt = self.create_strict_json_prompt(book, chapter, verses_dict, persona)
-        
+        # Reuse a previous translation if the source verses and persona
+        # prompt are byte-identical to a cached run
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(self._persona_context(persona), book, chapter, verses_dict)
+            cached_verses = self.cache.get(cache_key)
+            if cached_verses:
+                logger.info(f"⚡ Cache hit for {book} {chapter} as {persona}")
+                return cached_verses
+
+        persona_context, body_prompt = self._prompt_parts(book, chapter, verses_dict, persona)
+
         for attempt in range(max_retries):
             try:
                 logger.info(f"🔄 Translating {book} {chapter} as {persona} (attempt {attempt + 1}/{max_retries})")
-                
+
                 # Call the LLM
-                llm_output = self._call_llm(prompt)
+                llm_output = self._call_llm(body_prompt, system=persona_context)
                 
                 # Validate and repair the output
                 success, parsed_data, error_msg = self.validator.validate_and_repair(llm_output, verses_dict)
                 
                 if success:
                     logger.info(f"✅ Successfully translated {book} {chapter} as {persona}")
+                    # Only cache validated output — fallback data is a
+                    # placeholder and should be retried on the next run
+                    if self.cache:
+                        self.cache.set(cache_key, parsed_data["verses"])
                     return parsed_data["verses"]
                 else:
                     logger.warning(f"⚠️  Validation failed (attempt {attempt + 1}): {error_msg}")
@@ -195,22 +294,30 @@ class ChapterTranslator:
         
         return None
     
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, prompt: str, system: Optional[str] = None) -> str:
         """
         Call the LLM with the given prompt.
-        
+
         Args:
             prompt: Formatted prompt
-            
+            system: Optional system prompt; sent as the converse system
+                field where supported, otherwise prefixed onto the prompt
+
         Returns:
             Raw LLM response
         """
         try:
+            # Models without a native system field get it prefixed, which
+            # reproduces the old single-prompt layout byte for byte
+            if system and not self.model_id.startswith("us.deepseek"):
+                prompt = f"{system}{prompt}"
+
             if self.model_id.startswith("us.deepseek"):
-                # DeepSeek R1 uses converse() API
+                # DeepSeek R1 uses converse() API — the persona context goes
+                # in the system field so it's identical across chapters
                 response = self.bedrock.converse(
                     modelId=self.model_id,
-                    system=[{"text": "You are a helpful AI assistant that generates JSON output."}],
+                    system=[{"text": system or "You are a helpful AI assistant that generates JSON output."}],
                     messages=[
                         {
                             "role": "user",
@@ -375,10 +482,18 @@ class ChapterTranslator:
 class VerseByVerseTranslator:
     """Fallback translator for verse-by-verse translation."""
     
-    def __init__(self, model_id: str = "us.deepseek.r1-v1:0"):
-        """Initialize the verse-by-verse translator."""
+    def __init__(self, model_id: str = "us.deepseek.r1-v1:0", use_cache: bool = True):
+        """
+        Initialize the verse-by-verse translator.
+
+        Args:
+            model_id: Bedrock model ID to use
+            use_cache: If True, reuse cached verse translations for
+                unchanged (model, persona, verse text) inputs
+        """
         self.model_id = model_id
         self.bedrock = boto3.client('bedrock-runtime', region_name='us-east-1')
+        self.cache = TranslationCache() if use_cache else None
     
     def translate_verse(self, book: str, chapter: str, verse_num: str, verse_text: str, persona: str) -> Optional[str]:
         """
@@ -394,6 +509,16 @@ class VerseByVerseTranslator:
         Returns:
             Translated verse text or None if failed
         """
+        # KJV text is immutable, so identical (model, persona, verse) inputs
+        # can skip the Bedrock call entirely on reruns
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(f"{self.model_id}\x00{persona}", book, chapter,
+                                            {verse_num: verse_text})
+            cached = self.cache.get(cache_key)
+            if cached and verse_num in cached:
+                return cached[verse_num]
+
         # Load persona metadata
         try:
             from utils.persona_loader import get_persona
@@ -421,66 +546,151 @@ Return only the translated verse:"""
 Return only the translated verse:"""
         
         try:
-            # Format request body based on model type
-            if self.model_id.startswith("us.deepseek"):
-                # DeepSeek format
-                response = self.bedrock.converse(
-                    modelId=self.model_id,
-                    system=[{"text": "You are a helpful AI assistant."}],
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [{"text": prompt}]
-                        }
-                    ],
-                    inferenceConfig={
-                        "temperature": 0.7,
-                        "topP": 0.9,
-                        "maxTokens": 200
-                    }
-                )
-                
-                translated_text = response["output"]["message"]["content"][0]["text"].strip()
-                
-            elif self.model_id.startswith("anthropic.claude"):
-                # Claude format
-                request_body = {
-                    "prompt": f"\n\nHuman: {prompt}\n\nAssistant:",
-                    "max_tokens_to_sample": 200,
-                    "temperature": 0.7
-                }
-                
-                response = self.bedrock.invoke_model(
-                    modelId=self.model_id,
-                    body=json.dumps(request_body)
-                )
-                
-                response_body = json.loads(response['body'].read())
-                translated_text = response_body.get('completion', '').strip()
-                
-            else:
-                # Standard format for other models
-                request_body = {
-                    "prompt": prompt,
-                    "max_tokens": 200,
-                    "temperature": 0.7,
-                    "top_p": 0.9
-                }
-                
-                response = self.bedrock.invoke_model(
-                    modelId=self.model_id,
-                    body=json.dumps(request_body)
-                )
-                
-                response_body = json.loads(response['body'].read())
-                translated_text = response_body.get('text') or response_body.get('completion', '').strip()
-            
+            translated_text = self._invoke(prompt, max_tokens=200)
+            if translated_text and self.cache:
+                self.cache.set(cache_key, {verse_num: translated_text})
             return translated_text if translated_text else None
-            
+
         except Exception as e:
             logger.error(f"❌ Error translating verse {book} {chapter}:{verse_num}: {e}")
             return None
 
+    def _invoke(self, prompt: str, max_tokens: int = 200) -> str:
+        """
+        Call the model with the right request format for its family.
+
+        Args:
+            prompt: Formatted prompt
+            max_tokens: Maximum tokens for the completion
+
+        Returns:
+            Raw completion text
+        """
+        # Format request body based on model type
+        if self.model_id.startswith("us.deepseek"):
+            # DeepSeek format
+            response = self.bedrock.converse(
+                modelId=self.model_id,
+                system=[{"text": "You are a helpful AI assistant."}],
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [{"text": prompt}]
+                    }
+                ],
+                inferenceConfig={
+                    "temperature": 0.7,
+                    "topP": 0.9,
+                    "maxTokens": max_tokens
+                }
+            )
+
+            return response["output"]["message"]["content"][0]["text"].strip()
+
+        elif self.model_id.startswith("anthropic.claude"):
+            # Claude format
+            request_body = {
+                "prompt": f"\n\nHuman: {prompt}\n\nAssistant:",
+                "max_tokens_to_sample": max_tokens,
+                "temperature": 0.7
+            }
+
+            response = self.bedrock.invoke_model(
+                modelId=self.model_id,
+                body=json.dumps(request_body)
+            )
+
+            response_body = json.loads(response['body'].read())
+            return response_body.get('completion', '').strip()
+
+        else:
+            # Standard format for other models
+            request_body = {
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "temperature": 0.7,
+                "top_p": 0.9
+            }
+
+            response = self.bedrock.invoke_model(
+                modelId=self.model_id,
+                body=json.dumps(request_body)
+            )
+
+            response_body = json.loads(response['body'].read())
+            return response_body.get('text') or response_body.get('completion', '').strip()
+
+    def translate_verses_batch(self, book: str, chapter: str, verses_dict: Dict[str, str], persona: str,
+                               max_chars: int = 4000, max_items: int = 20) -> Dict[str, str]:
+        """
+        Translate many verses with a few batched model calls instead of one per verse.
+
+        Verses are packed into chunks bounded by item count and cumulative
+        character budget; each chunk is one prompt asking for a JSON object
+        mapping verse number to rewritten text. Verses the model skips or
+        garbles fall back to the per-verse path.
+
+        Args:
+            book: Bible book name
+            chapter: Chapter number
+            verses_dict: Dictionary of verse numbers to verse text
+            persona: Persona name for translation
+            max_chars: Character budget per batched prompt
+            max_items: Maximum verses per batched prompt
+
+        Returns:
+            Dictionary of verse numbers to translated text (failed verses omitted)
+        """
+        sorted_verses = sorted(verses_dict.items(), key=lambda x: int(x[0]))
+
+        # Pack verses into chunks by count and character budget
+        chunks = []
+        current = []
+        current_chars = 0
+        for verse_num, verse_text in sorted_verses:
+            if current and (len(current) >= max_items or current_chars + len(verse_text) > max_chars):
+                chunks.append(current)
+                current = []
+                current_chars = 0
+            current.append((verse_num, verse_text))
+            current_chars += len(verse_text)
+        if current:
+            chunks.append(current)
+
+        results = {}
+        for chunk in chunks:
+            verses_text = "\n".join([f"{verse_num}: {verse_text}" for verse_num, verse_text in chunk])
+            prompt = f"""You are {persona}. Rewrite each of the following verses of {book} {chapter} in your voice.
+
+Return ONLY a JSON object mapping each verse number to its rewritten text, like {{"1": "...", "2": "..."}}. No commentary, no markdown fences.
+
+{verses_text}"""
+
+            parsed = {}
+            try:
+                logger.info(f"🔄 Translating {len(chunk)} verses of {book} {chapter} in one call")
+                response_text = self._invoke(prompt, max_tokens=2000)
+
+                # Tolerate models that wrap the JSON in code fences anyway
+                cleaned = re.sub(r'^```(?:json)?|```$', '', response_text.strip(), flags=re.MULTILINE).strip()
+                parsed = json.loads(cleaned)
+                if not isinstance(parsed, dict):
+                    parsed = {}
+            except Exception as e:
+                logger.warning(f"⚠️  Batch verse response unusable for {book} {chapter}: {e}")
+
+            for verse_num, verse_text in chunk:
+                translated = parsed.get(verse_num) or parsed.get(str(int(verse_num)))
+                if translated and isinstance(translated, str):
+                    results[verse_num] = translated.strip()
+                else:
+                    # Per-verse fallback only for what the batch missed
+                    fallback = self.translate_verse(book, chapter, verse_num, verse_text, persona)
+                    if fallback:
+                        results[verse_num] = fallback
+
+        return results
+
 
 def main():
     """Test the chapter translator."""
@@ -5,12 +5,33 @@ Cost Calculator for Bible Translation
 Calculates estimated costs for AI translation based on token usage and model pricing.
 """
 
+import functools
+import hashlib
 import logging
-from typing import Dict, Any
+from collections import namedtuple
+from enum import IntEnum
+from typing import Dict, Any, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
 
+class Model(IntEnum):
+    """Known Bedrock models; values index the precomputed rate table."""
+    DEEPSEEK_R1 = 0
+    CLAUDE_HAIKU = 1
+    CLAUDE_SONNET = 2
+    LLAMA2_70B = 3
+
+
+# Per-token rates packed as a lightweight tuple, indexed by Model
+Rate = namedtuple("Rate", "input_per_token output_per_token")
+
+
 class CostCalculator:
     """Calculates translation costs based on token usage and model pricing."""
     
@@ -38,54 +59,133 @@ class CostCalculator:
         
         # Markup percentage for overhead
         self.markup_percentage = 0.10  # 10% markup
-    
-    def calculate_cost(self, input_tokens: int, output_tokens: int, model_id: str) -> float:
+
+        # Bedrock Batch Inference bills roughly half the real-time rate
+        self.batch_discount = 0.50
+
+        # Markup folded into per-token rates once, packed into a list of
+        # Rate tuples indexed by Model, so the hot path is two multiplies
+        # and an add with no string hashing or dict-of-dicts walk.
+        # model_pricing insertion order matches the Model enum values.
+        self._rate_table = [
+            Rate((pricing["input"] * (1 + self.markup_percentage)) / 1_000_000,
+                 (pricing["output"] * (1 + self.markup_percentage)) / 1_000_000)
+            for pricing in self.model_pricing.values()
+        ]
+        self._model_index = {model_id: Model(index)
+                             for index, model_id in enumerate(self.model_pricing)}
+
+        # Per-instance memoization keyed on (input, output, model, batch);
+        # repeated estimates (dashboards, compare_models) hit the cache
+        self._cached_cost = functools.lru_cache(maxsize=4096)(self._compute_cost)
+
+        # Token counting (same optional dependency handling as the translator)
+        try:
+            import tiktoken
+            self.encoder = tiktoken.get_encoding("cl100k_base")
+            self.tokenizer_available = True
+        except ImportError:
+            logger.warning("tiktoken not available, using rough estimation")
+            self.encoder = None
+            self.tokenizer_available = False
+
+        # Corpus-hash → token count, so repeated estimates over the same
+        # Bible don't redo the O(N) tokenize pass
+        self._corpus_token_cache = {}
+
+    def count_bible_tokens(self, kjv_data: Dict[str, Any]) -> int:
+        """
+        Count input tokens for a whole restructured Bible.
+
+        Renders each chapter the same "N. text" way the translator's prompt
+        does and tokenizes it, caching the total under a hash of the corpus.
+
+        Args:
+            kjv_data: Restructured KJV data
+
+        Returns:
+            Total input token count
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        chapters = []
+        for book, book_chapters in kjv_data.items():
+            for chapter, verses in book_chapters.items():
+                text = "\n".join(f"{verse_num}. {verse_text}"
+                                 for verse_num, verse_text in verses.items())
+                digest.update(text.encode('utf-8'))
+                chapters.append(text)
+
+        corpus_hash = digest.hexdigest()
+        if corpus_hash in self._corpus_token_cache:
+            return self._corpus_token_cache[corpus_hash]
+
+        if self.tokenizer_available:
+            total = sum(len(tokens) for tokens in self.encoder.encode_batch(chapters))
+        else:
+            # Rough estimation: ~4 characters per token
+            total = sum(len(text) // 4 for text in chapters)
+
+        self._corpus_token_cache[corpus_hash] = total
+        return total
+
+    def _compute_cost(self, input_tokens: int, output_tokens: int, model: Model,
+                      batch: bool) -> float:
+        """Compute cost from the precomputed per-token rate table."""
+        rate = self._rate_table[model]
+        total_cost = (input_tokens * rate.input_per_token
+                      + output_tokens * rate.output_per_token)
+
+        if batch:
+            total_cost *= self.batch_discount
+
+        return total_cost
+
+    def calculate_cost(self, input_tokens: int, output_tokens: int,
+                       model_id: Union[str, Model], batch: bool = False) -> float:
         """
         Calculate the cost for a translation job.
-        
+
         Args:
             input_tokens: Number of input tokens
             output_tokens: Number of output tokens
-            model_id: Bedrock model ID
-            
+            model_id: Bedrock model ID string, or a Model enum member
+            batch: If True, apply the Batch Inference discount
+
         Returns:
             Estimated cost in USD
         """
-        if model_id not in self.model_pricing:
-            logger.warning(f"⚠️  Unknown model {model_id}, using DeepSeek pricing")
-            model_id = "us.deepseek.r1-v1:0"
-        
-        pricing = self.model_pricing[model_id]
-        
-        # Calculate base cost
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        
-        base_cost = input_cost + output_cost
-        
-        # Add markup
-        total_cost = base_cost * (1 + self.markup_percentage)
-        
-        return total_cost
+        if not isinstance(model_id, Model):
+            model = self._model_index.get(model_id)
+            if model is None:
+                logger.warning(f"⚠️  Unknown model {model_id}, using DeepSeek pricing")
+                model = Model.DEEPSEEK_R1
+            model_id = model
+
+        return self._cached_cost(input_tokens, output_tokens, model_id, batch)
     
-    def estimate_bible_cost(self, persona: str, model_id: str = "us.deepseek.r1-v1:0") -> Dict[str, Any]:
+    def estimate_bible_cost(self, persona: str, model_id: str = "us.deepseek.r1-v1:0",
+                            kjv_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Estimate the cost for translating the entire Bible.
-        
+
         Args:
             persona: Persona name for translation
             model_id: Bedrock model ID
-            
+            kjv_data: Optional restructured KJV data; when provided, input
+                tokens are counted exactly instead of assumed
+
         Returns:
             Cost estimation details
         """
-        # Rough estimates based on KJV Bible statistics
-        # KJV Bible has approximately:
-        # - 783,137 words
-        # - ~1.2M tokens (roughly 1.5 tokens per word)
-        # - Output typically 20-50% longer depending on persona
-        
-        base_tokens = 1_200_000
+        if kjv_data is not None:
+            base_tokens = self.count_bible_tokens(kjv_data)
+        else:
+            # Rough estimates based on KJV Bible statistics
+            # KJV Bible has approximately:
+            # - 783,137 words
+            # - ~1.2M tokens (roughly 1.5 tokens per word)
+            # - Output typically 20-50% longer depending on persona
+            base_tokens = 1_200_000
         
         # Persona-specific expansion ratios
         persona_ratios = {
@@ -123,13 +223,46 @@ class CostCalculator:
         Returns:
             Dictionary of model costs
         """
-        costs = {}
-        
-        for model_id in self.model_pricing:
-            cost = self.calculate_cost(input_tokens, output_tokens, model_id)
-            costs[model_id] = cost
-        
-        return costs
+        # Enum-indexed lookups: no string hashing inside the loop
+        return {
+            model_id: self._cached_cost(input_tokens, output_tokens, model, False)
+            for model_id, model in self._model_index.items()
+        }
+
+    def compare_models_vec(self, input_tokens: List[int],
+                           output_tokens: List[int]) -> Dict[str, Any]:
+        """
+        Vectorized compare_models over arrays of token counts.
+
+        For parameter sweeps (cost vs. output length, Monte-Carlo over
+        persona ratios) this computes every model across all points with
+        NumPy broadcasting instead of a Python loop per point.
+
+        Args:
+            input_tokens: Sequence/array of input token counts
+            output_tokens: Sequence/array of output token counts (same length)
+
+        Returns:
+            Dictionary of model_id -> array (or list, without NumPy) of costs
+        """
+        if np is None:
+            logger.warning("numpy not available, comparing models point by point")
+            return {
+                model_id: [self._cached_cost(i, o, model, False)
+                           for i, o in zip(input_tokens, output_tokens)]
+                for model_id, model in self._model_index.items()
+            }
+
+        input_tokens = np.asarray(input_tokens, dtype=np.float64)
+        output_tokens = np.asarray(output_tokens, dtype=np.float64)
+        in_rates = np.array([rate.input_per_token for rate in self._rate_table])
+        out_rates = np.array([rate.output_per_token for rate in self._rate_table])
+
+        # (M, N): one fused multiply-add per model across all points
+        costs = (input_tokens[None, :] * in_rates[:, None]
+                 + output_tokens[None, :] * out_rates[:, None])
+
+        return {model_id: costs[model] for model_id, model in self._model_index.items()}
     
     def format_cost_breakdown(self, input_tokens: int, output_tokens: int, model_id: str) -> str:
         """
@@ -3,21 +3,53 @@
 Schema validator and repair utilities for LLM JSON output
 """
 
+import asyncio
 import json
 import re
 import logging
+import sys
 from typing import Dict, Any, Optional, Tuple
 
+# LLM outputs can be multi-KB; orjson parses them noticeably faster than
+# stdlib json and its JSONDecodeError also subclasses ValueError
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Compiled once — repair_json_string runs on every LLM response
+_RE_TRAILING_COMMA_OBJ = re.compile(r',\s*}')
+_RE_TRAILING_COMMA_ARR = re.compile(r',\s*]')
+
+# Persona prefixes for fallback verses, built once instead of per call
+_PERSONA_PREFIXES = {
+    "joe_rogan": "Dude, ",
+    "samuel_l_jackson": "Listen up, ",
+    "cardi_b": "Okurrr, ",
+    "maya_angelou": "With grace, ",
+    "ram_dass": "In consciousness, ",
+    "hunter_s_thompson": "In the gonzo spirit, "
+}
+
 class BibleTranslationValidator:
-    """Validates and repairs Bible translation JSON output."""
-    
-    def __init__(self):
-        self.required_keys = ["book", "chapter", "verses"]
-        self.verses_required_keys = ["book", "chapter"]
-    
-    def validate_structure(self, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """
+    Validates and repairs Bible translation JSON output.
+
+    Entirely stateless — everything is a staticmethod over class-level
+    constants, so reuse the module-level VALIDATOR instead of paying an
+    instantiation per LLM response.
+    """
+
+    # frozensets: O(1) membership and direct set algebra against dict keys
+    required_keys = frozenset(("book", "chapter", "verses"))
+    verses_required_keys = frozenset(("book", "chapter"))
+
+    @staticmethod
+    def validate_structure(data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
         Validate the basic structure of the JSON response.
         
@@ -29,75 +61,81 @@ class BibleTranslationValidator:
         """
         try:
             # Check required top-level keys
-            for key in self.required_keys:
-                if key not in data:
-                    return False, f"Missing required key: {key}"
-            
-            # Check verses object
-            if not isinstance(data["verses"], dict):
+            missing = BibleTranslationValidator.required_keys - data.keys()
+            if missing:
+                return False, f"Missing required key: {next(iter(missing))}"
+
+            # Check verses object — bind it once instead of re-subscripting
+            verses = data["verses"]
+            if not isinstance(verses, dict):
                 return False, "Verses must be an object"
-            
+
             # Check that verses has at least one entry
-            if not data["verses"]:
+            if not verses:
                 return False, "Verses object is empty"
-            
-            # Check verse number format (should be strings)
-            for verse_num in data["verses"].keys():
-                if not isinstance(verse_num, str):
-                    return False, f"Verse number {verse_num} must be a string"
+
+            # Check numbers and content in one pass over the dict.
+            # JSON object keys are always strings after parsing, so only
+            # the numeric check is needed on the key
+            for verse_num, content in verses.items():
                 if not verse_num.isdigit():
                     return False, f"Verse number {verse_num} must be numeric"
-            
-            # Check verse content (should be strings)
-            for verse_num, content in data["verses"].items():
                 if not isinstance(content, str):
                     return False, f"Verse {verse_num} content must be a string"
                 if not content.strip():
                     return False, f"Verse {verse_num} content is empty"
-            
+
             return True, None
-            
+
         except Exception as e:
             return False, f"Validation error: {str(e)}"
     
-    def repair_json_string(self, json_string: str) -> Optional[str]:
+    @staticmethod
+    def repair_json_string(json_string: str) -> Optional[Tuple[str, Dict[str, Any]]]:
         """
         Repair common JSON formatting issues.
-        
+
         Args:
             json_string: Raw JSON string from LLM
-            
+
         Returns:
-            Repaired JSON string or None if unrepairable
+            Tuple of (repaired JSON string, parsed data), or None if
+            unrepairable — the validating parse is returned so callers
+            don't parse the same output a second time
         """
         try:
-            # Remove markdown code blocks
-            json_string = re.sub(r'```json\s*', '', json_string)
-            json_string = re.sub(r'```\s*$', '', json_string)
-            json_string = re.sub(r'^```\s*', '', json_string)
-            
+            # Remove markdown code fences — fixed literals, so plain string
+            # ops beat the regex engine
+            json_string = json_string.strip()
+            if json_string.startswith('```json'):
+                json_string = json_string[7:].lstrip()
+            elif json_string.startswith('```'):
+                json_string = json_string[3:].lstrip()
+            if json_string.endswith('```'):
+                json_string = json_string[:-3].rstrip()
+
             # Remove leading/trailing text
             json_start = json_string.find('{')
             json_end = json_string.rfind('}') + 1
-            
+
             if json_start == -1 or json_end == 0:
                 return None
-            
+
             json_string = json_string[json_start:json_end]
-            
+
             # Fix common JSON issues
-            json_string = re.sub(r',\s*}', '}', json_string)  # Remove trailing commas
-            json_string = re.sub(r',\s*]', ']', json_string)  # Remove trailing commas in arrays
-            
-            # Try to parse to validate
-            json.loads(json_string)
-            return json_string
-            
+            json_string = _RE_TRAILING_COMMA_OBJ.sub('}', json_string)  # Remove trailing commas
+            json_string = _RE_TRAILING_COMMA_ARR.sub(']', json_string)  # Remove trailing commas in arrays
+
+            # The validating parse doubles as the result
+            return json_string, _loads(json_string)
+
         except Exception as e:
-            logger.warning(f"Failed to repair JSON string: {e}")
+            logger.warning("Failed to repair JSON string: %s", e)
             return None
     
-    def validate_and_repair(self, llm_output: str, expected_verses: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, Any]], str]:
+    @staticmethod
+    def validate_and_repair(llm_output: str, expected_verses: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, Any]], str]:
         """
         Validate and repair LLM output.
         
@@ -109,44 +147,69 @@ class BibleTranslationValidator:
             Tuple of (success, parsed_data, error_message)
         """
         try:
-            # First, try to repair the JSON string
-            repaired_json = self.repair_json_string(llm_output)
-            if not repaired_json:
-                return False, None, "Could not extract valid JSON from LLM output"
-            
-            # Parse the JSON
-            data = json.loads(repaired_json)
-            
+            # Fast path: most well-behaved outputs are already clean JSON,
+            # so try a direct parse before paying for fence stripping and
+            # trailing-comma regexes
+            try:
+                data = _loads(llm_output)
+            except ValueError:
+                repaired = BibleTranslationValidator.repair_json_string(llm_output)
+                if not repaired:
+                    return False, None, "Could not extract valid JSON from LLM output"
+                _repaired_json, data = repaired
+
             # Validate structure
-            is_valid, error_msg = self.validate_structure(data)
+            is_valid, error_msg = BibleTranslationValidator.validate_structure(data)
             if not is_valid:
                 return False, None, f"Structure validation failed: {error_msg}"
             
-            # Validate verse completeness
-            expected_verse_nums = set(expected_verses.keys())
-            actual_verse_nums = set(data["verses"].keys())
-            
-            missing_verses = expected_verse_nums - actual_verse_nums
-            extra_verses = actual_verse_nums - expected_verse_nums
-            
+            # Validate verse completeness — dict key views support set
+            # algebra directly, no intermediate set() materialization
+            missing_verses = expected_verses.keys() - data["verses"].keys()
+            extra_verses = data["verses"].keys() - expected_verses.keys()
+
             if missing_verses:
                 return False, None, f"Missing verses: {missing_verses}"
             
             if extra_verses:
-                logger.warning(f"Extra verses found: {extra_verses}")
+                logger.warning("Extra verses found: %s", extra_verses)
                 # Remove extra verses for database compatibility
                 for extra_verse in extra_verses:
                     del data["verses"][extra_verse]
             
-            logger.info(f"✅ Successfully validated and repaired JSON with {len(data['verses'])} verses")
+            logger.info("✅ Successfully validated and repaired JSON with %d verses", len(data["verses"]))
             return True, data, "Success"
             
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             return False, None, f"JSON parsing failed: {str(e)}"
         except Exception as e:
             return False, None, f"Validation error: {str(e)}"
     
-    def create_fallback_data(self, book: str, chapter: str, original_verses: Dict[str, str], persona: str) -> Dict[str, Any]:
+    @staticmethod
+    async def validate_and_repair_async(llm_output: str, expected_verses: Dict[str, str]) -> Tuple[bool, Optional[Dict[str, Any]], str]:
+        """
+        Async wrapper around validate_and_repair.
+
+        Parsing and repairing a multi-KB response is pure CPU work;
+        running it in a worker thread keeps the event loop free to
+        service in-flight Bedrock calls. run_in_executor rather than
+        asyncio.to_thread, which is 3.9+ while the project supports 3.8.
+
+        Args:
+            llm_output: Raw LLM response
+            expected_verses: Original verses for validation
+
+        Returns:
+            Tuple of (success, parsed_data, error_message)
+        """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            None, BibleTranslationValidator.validate_and_repair, llm_output, expected_verses
+        )
+
+    @staticmethod
+    def create_fallback_data(book: str, chapter: str, original_verses: Dict[str, str], persona: str) -> Dict[str, Any]:
         """
         Create fallback data structure when validation fails.
         
@@ -159,24 +222,22 @@ class BibleTranslationValidator:
         Returns:
             Fallback data structure
         """
-        # Add persona prefixes to original verses
-        persona_prefixes = {
-            "joe_rogan": "Dude, ",
-            "samuel_l_jackson": "Listen up, ",
-            "cardi_b": "Okurrr, ",
-            "maya_angelou": "With grace, ",
-            "ram_dass": "In consciousness, ",
-            "hunter_s_thompson": "In the gonzo spirit, "
+        # Add persona prefixes to original verses; intern the key so
+        # repeated fallbacks for the same persona hit identity compares
+        prefix = _PERSONA_PREFIXES.get(sys.intern(persona), "")
+
+        fallback_verses = {
+            verse_num: f"{prefix}{original_text.lower()}"
+            for verse_num, original_text in original_verses.items()
         }
-        
-        prefix = persona_prefixes.get(persona, "")
-        
-        fallback_verses = {}
-        for verse_num, original_text in original_verses.items():
-            fallback_verses[verse_num] = f"{prefix}{original_text.lower()}"
-        
+
         return {
             "book": book,
             "chapter": int(chapter),
             "verses": fallback_verses
-        } 
\ No newline at end of file
+        }
+
+
+# Shared stateless instance — prefer this over constructing a new
+# validator per response
+VALIDATOR = BibleTranslationValidator()
\ No newline at end of file
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for chapter translations.
+
+Keys are a blake2b digest of the persona prompt, book, chapter, and source
+verses, so a rerun only re-invokes Bedrock for chapters whose inputs
+actually changed — editing a persona prompt invalidates just that
+persona's entries.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """SQLite-backed KV cache mapping translation inputs to translated verses."""
+
+    def __init__(self, cache_dir: str = "data/cache/translations"):
+        """
+        Initialize the translation cache.
+
+        The connection is shared across the orchestrator's worker threads,
+        so statements run under a lock and the database uses WAL mode.
+
+        Args:
+            cache_dir: Directory for the SQLite cache database
+        """
+        cache_path = Path(cache_dir)
+        cache_path.mkdir(parents=True, exist_ok=True)
+
+        self.db_file = cache_path / "translations.db"
+        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, verses TEXT)"
+        )
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(persona_prompt: str, book: str, chapter: str, verses_dict: Dict[str, str]) -> str:
+        """
+        Build a content-addressed cache key.
+
+        Args:
+            persona_prompt: Full persona context string (versions the persona)
+            book: Bible book name
+            chapter: Chapter number
+            verses_dict: Dictionary of verse numbers to source verse text
+
+        Returns:
+            Hex digest uniquely identifying this translation input
+        """
+        payload = "\x00".join([
+            persona_prompt,
+            book,
+            chapter,
+            json.dumps(verses_dict, sort_keys=True)
+        ])
+        # blake2b is faster than sha256 on CPython and just as collision-safe here
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Look up cached translated verses.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Dictionary of verse numbers to translated text, or None on miss
+        """
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT verses FROM translations WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️  Cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, verses: Dict[str, str]) -> None:
+        """
+        Store translated verses for a key.
+
+        Args:
+            key: Cache key from make_key
+            verses: Dictionary of verse numbers to translated text
+        """
+        try:
+            with self._lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO translations (key, verses) VALUES (?, ?)",
+                    (key, json.dumps(verses, ensure_ascii=False))
+                )
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️  Cache write failed: {e}")